@@ -161,11 +161,13 @@ class AplicacaoPrincipal(tk.Tk):
                                      f"Erro fatal ao carregar o painel '{PanelClass.__name__}':\n\n{e}")
 
     def switch_panel_by_name(self, panel_name: str):
-        if panel_name not in self.panels: return
+        if panel_name not in self.panels or panel_name == self.current_panel_name: return
         if self.current_panel_name and self.current_panel_name in self.panels:
             self.panels[self.current_panel_name].pack_forget()
+            self.panels[self.current_panel_name].on_hide()
         self.current_panel_name = panel_name
         self.panels[panel_name].pack(fill="both", expand=True)
+        self.panels[panel_name].on_show()
 
     def _create_menubar(self) -> tk.Menu:
         menubar = tk.Menu(self)
@@ -217,7 +219,8 @@ class AplicacaoPrincipal(tk.Tk):
             if current_panel and hasattr(current_panel, '_carregar_tipos_vegetais'):
                 callback = current_panel._carregar_tipos_vegetais
 
-            controller = TiposVegetaisController(self, on_close_callback=callback)
+            controller = TiposVegetaisController(self, on_close_callback=callback,
+                                                 usuario=self.current_user['username'])
             controller.show()
         except Exception as e:
             messagebox.showerror("Erro Crítico", f"Não foi possível abrir a janela de gestão: {e}")
@@ -18,6 +18,17 @@ redirect_console_to_log = False
 enable_theme_menu = True
 log_level = DEBUG
 log_format = [%(asctime)s] [%(name)s] [%(levelname)-8s] - %(message)s
+query_cache_enabled = True
+query_cache_max_mb = 64
+query_cache_ttl_seconds = 300
+db_worker_threads = 4
+async_db_max_concurrency = 4
+audit_log_page_size = 200
+audit_mode = strict
+audit_queue_max_size = 10000
+audit_batch_size = 200
+audit_flush_interval_ms = 500
+ui_frame_budget_ms = 12
 """
     try:
         with open(_config_path, 'w', encoding='utf-8') as f:
@@ -41,6 +52,12 @@ def _get_boolean_setting(key, default=False):
     except (configparser.Error, ValueError):
         return default
 
+def _get_int_setting(key, default=0):
+    try:
+        return _parser.getint('Settings', key, fallback=default)
+    except (configparser.Error, ValueError):
+        return default
+
 def _get_string_setting(key, default=""):
     try:
         return _parser.get('Settings', key, fallback=default)
@@ -55,6 +72,26 @@ ENABLE_THEME_MENU = _get_boolean_setting('enable_theme_menu', default=True)
 
 MAX_LOGIN_ATTEMPTS = 3
 
+QUERY_CACHE_ENABLED = _get_boolean_setting('query_cache_enabled', default=True)
+QUERY_CACHE_MAX_MB = _get_int_setting('query_cache_max_mb', default=64)
+QUERY_CACHE_TTL_SECONDS = _get_int_setting('query_cache_ttl_seconds', default=300)
+
+DB_WORKER_THREADS = max(1, _get_int_setting('db_worker_threads', default=4))
+ASYNC_DB_MAX_CONCURRENCY = max(1, _get_int_setting('async_db_max_concurrency', default=4))
+AUDIT_LOG_PAGE_SIZE = max(1, _get_int_setting('audit_log_page_size', default=200))
+
+# 'strict' grava o log na mesma transação da alteração; 'queued' grava em lotes por uma thread.
+AUDIT_MODE = _get_string_setting('audit_mode', default='strict').strip().lower()
+if AUDIT_MODE not in ('strict', 'queued'):
+    print(f"Aviso: audit_mode '{AUDIT_MODE}' inválido. Usando 'strict'.", file=sys.stderr)
+    AUDIT_MODE = 'strict'
+AUDIT_QUEUE_MAX_SIZE = max(1, _get_int_setting('audit_queue_max_size', default=10000))
+AUDIT_BATCH_SIZE = max(1, _get_int_setting('audit_batch_size', default=200))
+AUDIT_FLUSH_INTERVAL_MS = max(1, _get_int_setting('audit_flush_interval_ms', default=500))
+
+# Tempo máximo (ms) de trabalho por quadro ao preencher Treeviews em fatias.
+UI_FRAME_BUDGET_MS = max(1, _get_int_setting('ui_frame_budget_ms', default=12))
+
 LOG_LEVEL_STR = _get_string_setting('log_level', default="INFO").upper()
 LOG_FORMAT = _get_string_setting('log_format', default="[%(asctime)s] [%(name)s] [%(levelname)-8s] - %(message)s")
 
@@ -0,0 +1,70 @@
+"""
+Compara o preenchimento de uma ttk.Treeview linha a linha (tree.insert por linha, como
+os controllers faziam) com a inserção em lote de panels.tree_binder.bulk_insert
+(uma chamada ao Tcl por lote de BULK_INSERT_CHUNK_SIZE linhas) e com
+TreeviewBinder.bind_rows, que usa o mesmo lote nas cargas iniciais.
+
+Uso: python instalacao/benchmark_treeview.py [quantidades...]   (padrão: 1000 10000 100000)
+Requer um display (a Treeview é criada em uma janela oculta).
+"""
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from tkinter import ttk
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from panels.tree_binder import TreeviewBinder, bulk_insert, BULK_INSERT_CHUNK_SIZE
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+REPETITIONS = 3
+
+def make_rows(count: int) -> list:
+    return [(i, f"Vegetal {i}", f"Tipo {i % 7}") for i in range(1, count + 1)]
+
+def per_row(tree, rows):
+    for row in rows:
+        tree.insert("", "end", values=list(row))
+
+def bulk(tree, rows):
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        bulk_insert(tree, [(str(row[0]), row) for row in rows[start:start + BULK_INSERT_CHUNK_SIZE]])
+
+def binder(tree, rows):
+    TreeviewBinder(tree).bind_rows(rows)
+
+def measure(root, tree, method, rows) -> float:
+    """Menor tempo (ms) entre as repetições, incluindo o redesenho pendente."""
+    best = None
+    for _ in range(REPETITIONS):
+        tree.delete(*tree.get_children())
+        root.update_idletasks()
+        started = time.perf_counter()
+        method(tree, rows)
+        root.update_idletasks()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(sizes):
+    root = tk.Tk()
+    root.withdraw()
+    tree = ttk.Treeview(root, columns=('id', 'nome', 'tipo'), show='headings')
+    tree.pack()
+
+    print(f"{'linhas':>8} | {'linha a linha':>14} | {'bulk_insert':>12} | {'bind_rows':>10} | {'ganho':>6}")
+    print("-" * 63)
+    for count in sizes:
+        rows = make_rows(count)
+        loop_ms = measure(root, tree, per_row, rows)
+        bulk_ms = measure(root, tree, bulk, rows)
+        binder_ms = measure(root, tree, binder, rows)
+        print(f"{count:>8} | {loop_ms:>11.1f} ms | {bulk_ms:>9.1f} ms | {binder_ms:>7.1f} ms | "
+              f"{loop_ms / bulk_ms:>5.1f}x")
+    root.destroy()
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -5,6 +5,19 @@ import re
 from pathlib import Path
 import sys                                                      
 
+try:
+    PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    from persistencia.pool_settings import POOL_CLASSES, POOL_DEFAULTS, validate_pool_settings
+except ImportError as e:
+    messagebox.showerror("Erro Crítico de Importação",
+                         f"Não foi possível importar as configurações de pool: {e}\n\n"
+                         f"Certifique-se de que este script está na pasta 'instalacao' "
+                         f"e que a pasta 'persistencia' existe na raiz do projeto.")
+    sys.exit(1)
+
 BLOCK_DEFINITIONS = {
     'sqlserver': ['type', 'host', 'port', 'dbname', 'user', 'password'],
     'sqlite': ['type', 'path'],
@@ -80,6 +93,55 @@ class DatabaseConfigManager:
                     new_line = f"{indent_space}#{content}"
                 self.lines[line_index] = new_line.rstrip() + os.linesep
 
+    def _pool_section_range(self):
+        """Retorna (início, fim) das linhas da seção [pool], ou None se ela não existir."""
+        start = None
+        for i, line in enumerate(self.lines):
+            stripped = line.strip()
+            if stripped.startswith('['):
+                if start is not None:
+                    return start, i
+                if stripped.split(']', 1)[0].strip('[ ').lower() == 'pool':
+                    start = i + 1
+        return (start, len(self.lines)) if start is not None else None
+
+    def get_pool_settings(self):
+        """Lê as chaves ativas (não comentadas) da seção [pool]."""
+        section = self._pool_section_range()
+        if section is None:
+            return {}
+        settings = {}
+        for line in self.lines[section[0]:section[1]]:
+            clean_line = line.strip()
+            if clean_line and not clean_line.startswith(('#', ';')) and '=' in clean_line:
+                key, value = clean_line.split('=', 1)
+                settings[key.strip()] = value.strip()
+        return settings
+
+    def set_pool_settings(self, settings):
+        """Grava as chaves na seção [pool], substituindo as existentes ou criando a seção ao final."""
+        section = self._pool_section_range()
+        if section is None:
+            if self.lines and self.lines[-1].strip():
+                self.lines.append(os.linesep)
+            self.lines.append(f"[pool]{os.linesep}")
+            section = (len(self.lines), len(self.lines))
+
+        pending = dict(settings)
+        for i in range(section[0], section[1]):
+            clean_line = self.lines[i].strip()
+            if clean_line.startswith(('#', ';')) or '=' not in clean_line:
+                continue
+            key = clean_line.split('=', 1)[0].strip()
+            if key in pending:
+                self.lines[i] = f"{key} = {pending.pop(key)}{os.linesep}"
+
+        insert_at = section[1]
+        while insert_at > section[0] and not self.lines[insert_at - 1].strip():
+            insert_at -= 1
+        new_lines = [f"{key} = {value}{os.linesep}" for key, value in pending.items()]
+        self.lines[insert_at:insert_at] = new_lines
+
     def save_config(self):
         with open(self.filepath, 'w', encoding='utf-8') as f:
             f.writelines(self.lines)
@@ -92,7 +154,7 @@ class App(tk.Tk):
         self.title("Configurador de Conexão (banco.ini)")
 
         w = 500                     
-        h = 400
+        h = 640
 
         sw = self.winfo_screenwidth()
         sh = self.winfo_screenheight()
@@ -102,11 +164,13 @@ class App(tk.Tk):
 
         self.geometry(f"{w}x{h}+{x}+{y}")
 
-        self.minsize(450, 350)
+        self.minsize(450, 560)
 
         self._setup_styles()
 
         self.selected_db = tk.StringVar()
+        self.pool_vars = {key: tk.StringVar(value=str(value)) for key, value in POOL_DEFAULTS.items()}
+        self.pool_vars['pool_pre_ping'] = tk.BooleanVar(value=POOL_DEFAULTS['pool_pre_ping'])
         self.status_label = ttk.Label(self, text="", style="Status.TLabel")
 
         main_container = ttk.Frame(self, padding=15)
@@ -131,6 +195,7 @@ class App(tk.Tk):
         try:
             self.manager.load_config()
             self._update_radio_buttons()
+            self._populate_pool_fields()
             active_db = self.manager.get_active_db()
             if active_db:
                 self.selected_db.set(active_db)
@@ -154,6 +219,8 @@ class App(tk.Tk):
                                           padding=15)
         self.radio_frame.pack(fill="both", expand=True, pady=10)
 
+        self._create_pool_widgets(parent)
+
         self.save_button = ttk.Button(parent, text="Salvar e Ativar Selecionado", command=self.save_selection,
                                       style="Success.TButton", state="disabled")
         self.save_button.pack(pady=5, fill="x", ipady=5)
@@ -163,6 +230,54 @@ class App(tk.Tk):
 
         self.status_label.pack(pady=(10, 0))
 
+    def _create_pool_widgets(self, parent):
+        """Cria os campos de edição da seção [pool] do banco.ini."""
+        pool_frame = ttk.LabelFrame(parent, text="Pool de Conexões", padding=10)
+        pool_frame.pack(fill="x", pady=(0, 10))
+        pool_frame.columnconfigure(1, weight=1)
+
+        fields = [
+            ('pool_class', "Tipo de pool:"),
+            ('pool_size', "Conexões mantidas (pool_size):"),
+            ('max_overflow', "Conexões extras (max_overflow):"),
+            ('pool_timeout', "Espera por conexão, s (pool_timeout):"),
+            ('pool_recycle', "Reciclar após, s (pool_recycle):"),
+        ]
+        for row, (key, label) in enumerate(fields):
+            ttk.Label(pool_frame, text=label).grid(row=row, column=0, sticky="w", pady=2)
+            if key == 'pool_class':
+                widget = ttk.Combobox(pool_frame, textvariable=self.pool_vars[key], values=list(POOL_CLASSES),
+                                      state="readonly")
+            else:
+                widget = ttk.Entry(pool_frame, textvariable=self.pool_vars[key])
+            widget.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=2)
+
+        ttk.Checkbutton(pool_frame, text="Testar conexão antes do uso (pool_pre_ping)",
+                        variable=self.pool_vars['pool_pre_ping']).grid(row=len(fields), column=0, columnspan=2,
+                                                                       sticky="w", pady=(4, 0))
+
+    def _populate_pool_fields(self):
+        """Preenche os campos do pool com os valores do arquivo (validados) ou os padrões."""
+        try:
+            settings = validate_pool_settings(self.manager.get_pool_settings())
+        except ValueError as e:
+            settings = dict(POOL_DEFAULTS)
+            self.show_error(f"Seção [pool] inválida, exibindo valores padrão: {e}")
+        for key, value in settings.items():
+            self.pool_vars[key].set(value if key == 'pool_pre_ping' else str(value))
+
+    def _collect_pool_settings(self):
+        """Lê e valida os campos do pool; levanta ValueError com a mensagem do campo inválido."""
+        settings = validate_pool_settings({key: var.get() for key, var in self.pool_vars.items()})
+        formatted = {}
+        for key, value in settings.items():
+            if isinstance(value, bool):
+                value = str(value).lower()
+            elif isinstance(value, float) and value.is_integer():
+                value = int(value)
+            formatted[key] = str(value)
+        return formatted
+
     def _update_radio_buttons(self):
         """Limpa e recria os radio buttons com base nos dados carregados."""
         for widget in self.radio_frame.winfo_children():
@@ -191,8 +306,15 @@ class App(tk.Tk):
             self.show_error("Nenhum banco de dados foi selecionado.")
             return
 
+        try:
+            pool_settings = self._collect_pool_settings()
+        except ValueError as e:
+            self.show_error(f"Configuração de pool inválida: {e}")
+            return
+
         try:
             self.manager.activate_db(chosen_db)
+            self.manager.set_pool_settings(pool_settings)
             self.manager.save_config()
             self.status_label.config(text=f"Sucesso! '{chosen_db}' agora está ativo no arquivo banco.ini.",
                                      foreground="green")
@@ -200,6 +322,7 @@ class App(tk.Tk):
             self.manager.load_config()
             self.selected_db.set(self.manager.get_active_db())
             self._update_radio_buttons()
+            self._populate_pool_fields()
 
         except Exception as e:
             self.show_error(f"Erro ao salvar: {e}")
@@ -259,6 +382,17 @@ path = NexlifyTTk.db #
 #dbname = NexlifyTTk # 
 #user = gAAAAABo52D7Wefg0RLLMr62vnJinZeI5CMPv46SR-QgTHB18DdC9RmvR53QM4MBQOlLj_bUo0Rouzp8LuMWJfW2FjP4Du387w== # 
 #password = gAAAAABo52D7sEBmtfcCv2shxybef66zojupLPMP25CTQ8Z5TzQMw8gw8CHLwJ_CN1qsg3kkIgypYqpMmsRiRuH0X5QXjhvMXQ== # 
+
+[sqlite]
+profile = balanced
+
+[pool]
+pool_class = QueuePool
+pool_size = 5
+max_overflow = 10
+pool_timeout = 30
+pool_recycle = 1800
+pool_pre_ping = true
 """
                 with open(ini_path, 'w', encoding='utf-8') as f:
                     f.write(ini_content)
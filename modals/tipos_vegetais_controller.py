@@ -3,8 +3,8 @@ from .tipos_vegetais_model import TiposVegetaisModel
 from .tipos_vegetais_view import TiposVegetaisView
 
 class TiposVegetaisController:
-    def __init__(self, parent, on_close_callback=None):
-        self.model = TiposVegetaisModel()
+    def __init__(self, parent, on_close_callback=None, usuario: str = None):
+        self.model = TiposVegetaisModel(usuario)
         self.view = TiposVegetaisView(parent)
         self.view.set_controller(self)
         self.on_close_callback = on_close_callback
@@ -1,8 +1,14 @@
-import pandas as pd
 from sqlalchemy import exc
 from persistencia.repository import GenericRepository
 
 class TiposVegetaisModel:
+    def __init__(self, usuario: str = None):
+        self.usuario = usuario
+
+    def _audit(self, acao: str):
+        """Registro para a trilha de auditoria (None quando o usuário não foi informado)."""
+        return (self.usuario, acao) if self.usuario else None
+
     def get_all_tipos(self):
         try:
                                               
@@ -16,8 +22,8 @@ class TiposVegetaisModel:
             raise ValueError("O campo 'Nome' é obrigatório.")   
         try:
                                                  
-            df = pd.DataFrame([{'nome': nome}])   
-            GenericRepository.write_dataframe_to_table(df, "tipos_vegetais")   
+            GenericRepository.insert_row("tipos_vegetais", {'nome': nome},
+                                         audit=self._audit(f"Tipo de vegetal '{nome}' cadastrado."))
         except exc.IntegrityError:   
                                                                        
             raise ValueError(f"O nome '{nome}' já existe.")   
@@ -30,7 +36,8 @@ class TiposVegetaisModel:
             raise ValueError("O campo 'Nome' é obrigatório.")   
         try:
                                                          
-            GenericRepository.update_table("tipos_vegetais", {'nome': nome}, {'id': item_id})   
+            GenericRepository.update_table("tipos_vegetais", {'nome': nome}, {'id': item_id},
+                                           audit=self._audit(f"Tipo de vegetal ID {item_id} renomeado para '{nome}'."))
         except exc.IntegrityError:   
                                                                        
             raise ValueError(f"O nome '{nome}' já existe.")   
@@ -41,7 +48,8 @@ class TiposVegetaisModel:
     def delete_tipo(self, item_id: int):
         try:
                                                
-            GenericRepository.delete_from_table("tipos_vegetais", {'id': item_id})   
+            GenericRepository.delete_from_table("tipos_vegetais", {'id': item_id},
+                                                audit=self._audit(f"Tipo de vegetal ID {item_id} excluído."))
         except exc.IntegrityError:
 
             raise ValueError("Não foi possível excluir. Este tipo está em uso por um ou mais vegetais.")   
@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from panels.row_adapter import dataframe_to_rows
+from panels.tree_binder import TreeviewBinder
+
 class TiposVegetaisView(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -66,6 +69,7 @@ class TiposVegetaisView(tk.Toplevel):
         self.tree.heading('nome', text='Nome')
         self.tree.column('id', width=50, anchor='center')
         self.tree.column('nome', width=200)
+        self.tree_binder = TreeviewBinder(self.tree)
 
         scrollbar = ttk.Scrollbar(inner_frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=scrollbar.set)
@@ -74,11 +78,7 @@ class TiposVegetaisView(tk.Toplevel):
         scrollbar.pack(side='right', fill='y')
 
     def populate_treeview(self, data):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        if not data.empty:
-            for _, row in data.iterrows():
-                self.tree.insert("", "end", values=list(row))
+        self.tree_binder.bind_rows(dataframe_to_rows(data))
 
     def get_form_data(self):
         return {'nome': self.nome_var.get().strip()}
@@ -0,0 +1,140 @@
+import logging
+import time
+import tkinter as tk
+from concurrent.futures import CancelledError
+
+class BackgroundTask:
+    """
+    Ponte entre um Future do executor de banco e o loop do Tk.
+
+    O Tk não é thread-safe: em vez de a thread de trabalho tocar nos widgets, a tarefa verifica
+    o Future periodicamente com after() e chama 'on_success(resultado)' ou 'on_error(exceção)'
+    já na thread da interface. Após cancel() nenhum callback é chamado, mesmo que a consulta
+    já em andamento termine (ela não pode ser interrompida, mas o resultado é descartado).
+    """
+    POLL_INTERVAL_MS = 25
+
+    def __init__(self, widget, future, on_success=None, on_error=None, on_done=None):
+        self.widget = widget
+        self.future = future
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_done = on_done
+        self.cancelled = False
+        self.finished = False
+        self._after_id = widget.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self) -> bool:
+        """
+        Descarta a tarefa. Retorna True se a função nem chegou a executar (o Future foi
+        cancelado na fila do executor) e False se ela já estava em andamento ou concluída.
+        """
+        if self.finished:
+            return False
+        self.cancelled = True
+        not_started = self.future.cancel()
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self._finish()
+        return not_started
+
+    def _poll(self):
+        self._after_id = None
+        if self.cancelled:
+            return
+        if not self.future.done():
+            self._after_id = self.widget.after(self.POLL_INTERVAL_MS, self._poll)
+            return
+        try:
+            result = self.future.result()
+        except CancelledError:
+            self._finish()
+            return
+        except Exception as e:
+            self._finish()
+            if self.on_error:
+                self.on_error(e)
+            else:
+                logging.getLogger("main_app").error(f"Falha em tarefa de banco em segundo plano: {e}", exc_info=e)
+            return
+        self._finish()
+        if self.on_success:
+            self.on_success(result)
+
+    def _finish(self):
+        self.finished = True
+        if self.on_done:
+            self.on_done(self)
+
+class TimeSlicedTask:
+    """
+    Consome um gerador na thread da interface em fatias de tempo.
+
+    A cada fatia o gerador avança até esgotar 'budget_ms'; o restante é reagendado com
+    after(), devolvendo o controle ao loop do Tk entre as fatias, de modo que rolagem e
+    cliques continuam respondendo durante cargas longas. O gerador produz (feitos, total),
+    guardado em 'progress' e repassado a 'on_progress(tarefa)' ao fim de cada fatia.
+    cancel() fecha o gerador; 'on_complete(retorno do gerador)' só é chamado se ele terminar
+    e 'on_done(tarefa)' sempre, inclusive após o cancelamento.
+    """
+    SLICE_INTERVAL_MS = 1
+
+    def __init__(self, widget, steps, budget_ms: int, on_progress=None, on_complete=None, on_done=None):
+        self.widget = widget
+        self.steps = steps
+        self.budget_ms = budget_ms
+        self.on_progress = on_progress
+        self.on_complete = on_complete
+        self.on_done = on_done
+        self.progress = None
+        self.cancelled = False
+        self.finished = False
+        self._after_id = None
+
+    def start(self):
+        """Executa a primeira fatia imediatamente (cargas pequenas terminam sem reagendar)."""
+        self._run_slice()
+        return self
+
+    def cancel(self):
+        if self.finished:
+            return
+        self.cancelled = True
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self.steps.close()
+        self._finish()
+
+    def _run_slice(self):
+        self._after_id = None
+        if self.cancelled:
+            return
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        try:
+            while time.perf_counter() < deadline:
+                self.progress = next(self.steps)
+        except StopIteration as done:
+            self._finish()
+            if self.on_complete:
+                self.on_complete(done.value)
+            return
+        except Exception as e:
+            self._finish()
+            logging.getLogger("main_app").error(f"Falha em tarefa incremental da interface: {e}", exc_info=e)
+            return
+        if self.on_progress:
+            self.on_progress(self)
+        self._after_id = self.widget.after(self.SLICE_INTERVAL_MS, self._run_slice)
+
+    def _finish(self):
+        self.finished = True
+        if self.on_done:
+            self.on_done(self)
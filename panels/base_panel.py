@@ -1,5 +1,9 @@
                       
+import logging
 from tkinter import ttk
+import config
+from persistencia.db_executor import DatabaseExecutor
+from .background_task import BackgroundTask, TimeSlicedTask
 
 class BasePanel(ttk.Frame):
     PANEL_NAME = "Nome do Painel"
@@ -9,10 +13,152 @@ class BasePanel(ttk.Frame):
     def __init__(self, parent, app_controller, **kwargs):
         super().__init__(parent, **kwargs)
         self.app = app_controller
+        self._background_tasks = {}
+        self._interrupted_tasks = {}
+        self._reload_on_show = False
+        self._populations = {}
+        self._busy_label = None
         self.create_widgets()
 
     def create_widgets(self):
         raise NotImplementedError("Cada painel deve implementar o método 'create_widgets'.")
 
     def show_placeholder_alert(self):
-        self.app.show_placeholder_alert()
\ No newline at end of file
+        self.app.show_placeholder_alert()
+
+    def _usuario_logado(self) -> str:
+        """Login do usuário da sessão, registrado na trilha de auditoria."""
+        return self.app.get_current_user()['username']
+
+    def run_in_background(self, fn, *args, on_success=None, on_error=None, key=None, **kwargs):
+        """
+        Executa 'fn(*args, **kwargs)' no executor de banco e chama 'on_success(resultado)' ou
+        'on_error(exceção)' na thread da interface. Uma nova tarefa com a mesma 'key' cancela a
+        anterior (ex.: recargas seguidas da mesma lista). Enquanto houver tarefas pendentes o
+        painel exibe o indicador de ocupado.
+        """
+        key = key if key is not None else object()
+        previous = self._background_tasks.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        self._interrupted_tasks.pop(key, None)
+
+        future = DatabaseExecutor.submit(fn, *args, **kwargs)
+        task = BackgroundTask(self, future, on_success=on_success, on_error=on_error, on_done=self._on_task_done)
+        task.key = key
+        task.spec = (fn, args, kwargs, on_success, on_error)
+        self._background_tasks[key] = task
+        self._update_busy_indicator()
+        return task
+
+    def page_in_background(self, tree, key):
+        """
+        Liga a rolagem da VirtualTreeview 'tree' à busca de páginas no executor de banco: quando
+        a janela visível alcança o fim das linhas carregadas, a próxima página da fonte
+        (KeysetPageSource com auto_fetch=False) é buscada em segundo plano e a Treeview é
+        redesenhada ao recebê-la. Só uma busca por 'key' fica pendente de cada vez.
+        """
+        def on_error(source, e):
+            logging.getLogger("main_app").error(f"Falha ao buscar a próxima página de dados: {e}", exc_info=e)
+            source.error = e
+            source.has_more = False
+
+        def load_more(source):
+            if key in self._background_tasks:
+                return
+            self.run_in_background(source.fetch_more, key=key,
+                                   on_success=lambda _: tree.refresh(),
+                                   on_error=lambda e: on_error(source, e))
+
+        tree.set_load_more(load_more)
+
+    def populate_in_slices(self, binder, rows, key='populate', on_complete=None):
+        """
+        Aplica 'rows' à Treeview do 'binder' (TreeviewBinder) em fatias de até
+        ui_frame_budget_ms por quadro, exibindo o progresso no indicador do painel. Uma nova
+        carga com a mesma 'key' cancela a anterior, que para onde estiver; a nova parte dos
+        itens já exibidos. 'on_complete(contagem)' recebe o retorno de bind_rows().
+        """
+        previous = self._populations.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        task = TimeSlicedTask(self, binder.iter_apply(rows), config.UI_FRAME_BUDGET_MS,
+                              on_progress=lambda _: self._update_busy_indicator(),
+                              on_complete=on_complete, on_done=self._on_population_done)
+        task.key = key
+        self._populations[key] = task
+        self._update_busy_indicator()
+        return task.start()
+
+    def cancel_background_tasks(self):
+        """Cancela as tarefas pendentes do painel; seus callbacks não serão chamados."""
+        for task in list(self._background_tasks.values()):
+            task.cancel()
+
+    def on_hide(self):
+        """
+        Chamado pela aplicação quando o painel deixa de ser exibido. As cargas pendentes são
+        canceladas; as que ainda estavam na fila do executor são guardadas para serem
+        reenviadas em on_show(). As que já estavam em execução não podem ser interrompidas e
+        reenviá-las repetiria o efeito (ex.: fetch_more buscaria a página seguinte), então
+        on_show() chama reload() para recarregar o painel do zero.
+        """
+        for key, task in list(self._background_tasks.items()):
+            if task.cancel():
+                self._interrupted_tasks[key] = task.spec
+            else:
+                self._reload_on_show = True
+
+    def on_show(self):
+        """Chamado pela aplicação quando o painel volta a ser exibido."""
+        if self._reload_on_show:
+            self._reload_on_show = False
+            # As cargas reenviadas por reload() descartam as entradas guardadas com a mesma key.
+            self.reload()
+        interrupted, self._interrupted_tasks = self._interrupted_tasks, {}
+        for key, (fn, args, kwargs, on_success, on_error) in interrupted.items():
+            self.run_in_background(fn, *args, on_success=on_success, on_error=on_error, key=key, **kwargs)
+
+    def reload(self):
+        """
+        Recarrega os dados exibidos pelo painel. Deve ser idempotente; os painéis que carregam
+        dados em segundo plano a sobrescrevem.
+        """
+        pass
+
+    def destroy(self):
+        self._interrupted_tasks.clear()
+        self._reload_on_show = False
+        self.cancel_background_tasks()
+        for task in list(self._populations.values()):
+            task.cancel()
+        super().destroy()
+
+    def _on_task_done(self, task):
+        if self._background_tasks.get(task.key) is task:
+            del self._background_tasks[task.key]
+        self._update_busy_indicator()
+
+    def _on_population_done(self, task):
+        if self._populations.get(task.key) is task:
+            del self._populations[task.key]
+        self._update_busy_indicator()
+
+    def _update_busy_indicator(self):
+        if not self.winfo_exists():
+            return
+        busy = bool(self._background_tasks or self._populations)
+        self.configure(cursor="watch" if self._background_tasks else "")
+        if busy:
+            text = "⏳ Carregando..."
+            progress = [task.progress for task in self._populations.values() if task.progress]
+            if progress and not self._background_tasks:
+                done, total = sum(p[0] for p in progress), sum(p[1] for p in progress)
+                text = f"⏳ Exibindo linhas... {done * 100 // max(total, 1)}%"
+            if self._busy_label is None:
+                self._busy_label = ttk.Label(self)
+                self._busy_label.place(relx=1.0, rely=0.0, anchor="ne")
+            self._busy_label.configure(text=text)
+        elif self._busy_label is not None:
+            self._busy_label.destroy()
+            self._busy_label = None
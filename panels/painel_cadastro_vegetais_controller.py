@@ -1,12 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
 import config
 
 from panels.base_panel import BasePanel   
 from persistencia.repository import GenericRepository   
+from persistencia.reference_cache import ReferenceCache
 from modals.tipos_vegetais_controller import TiposVegetaisController   
 from .painel_cadastro_vegetais_view import CadastroVegetaisView
+from .tree_binder import TreeviewBinder
+from .row_adapter import dataframe_to_rows
+
+# Linhas por consulta na leitura da lista completa de vegetais.
+READ_PAGE_SIZE = 2000
 
 class PainelCadastroVegetais(BasePanel):   
     """Controller para a tela de cadastro de vegetais."""
@@ -28,33 +33,50 @@ class PainelCadastroVegetais(BasePanel):
 
         self.view = CadastroVegetaisView(self, controller=self)   
         self.view.pack(fill="both", expand=True)   
+        self.tree_binder = TreeviewBinder(self.view.tree)
         self._carregar_dados()   
         self._carregar_tipos_vegetais()   
 
+    def reload(self):
+        self._carregar_dados()
+        self._carregar_tipos_vegetais()
+
     def _carregar_dados(self):
-        """Carrega a lista de vegetais já cadastrados na Treeview."""
-        try:
-            for item in self.view.tree.get_children():
-                self.view.tree.delete(item)
+        """Carrega em segundo plano a lista de vegetais já cadastrados na Treeview."""
+        self.run_in_background(
+            self._ler_vegetais, key='vegetais',
+            on_success=self._exibir_vegetais,
+            on_error=lambda e: messagebox.showerror(
+                "Erro de Carga", f"Não foi possível carregar a lista de vegetais.\n{e}", parent=self))
+
+    @staticmethod
+    def _ler_vegetais():
+        """
+        Executada no executor de banco: a conversão para tuplas também fica fora da thread do Tk.
+        A lista é lida em páginas (keyset por nome e id), de modo que cada consulta é limitada
+        e só uma página por vez fica em DataFrame.
+        """
+        linhas, token = [], None
+        while True:
+            df, token = GenericRepository.read_vegetais_com_tipo_page(READ_PAGE_SIZE, token)
+            linhas.extend(dataframe_to_rows(df))
+            if token is None:
+                return linhas
 
-            df_vegetais = GenericRepository.read_vegetais_com_tipo()   
-            if not df_vegetais.empty:   
-                for _, row in df_vegetais.iterrows():   
-                    self.view.tree.insert("", "end", values=list(row))   
-        except Exception as e:
-            messagebox.showerror("Erro de Carga", f"Não foi possível carregar a lista de vegetais.\n{e}", parent=self)   
+    def _exibir_vegetais(self, linhas):
+        # Aplica só as diferenças (por id), em fatias, sem travar a janela em listas grandes.
+        self.populate_in_slices(self.tree_binder, linhas, key='vegetais')
 
     def _carregar_tipos_vegetais(self):
         """Carrega ou recarrega os tipos de vegetais no Combobox."""
-        try:
-                                                                     
-            df_tipos = GenericRepository.read_table_to_dataframe("tipos_vegetais")   
+        self.run_in_background(
+            ReferenceCache.names, 'tipos_vegetais', key='tipos_vegetais',
+            on_success=self._exibir_tipos_vegetais,
+            on_error=lambda e: messagebox.showerror(
+                "Erro de Carga", f"Não foi possível recarregar os tipos de vegetais.\n{e}", parent=self))
 
-            tipos_lista = sorted(df_tipos['nome'].tolist()) if not df_tipos.empty else []   
-            self.view.tipo_combobox['values'] = tipos_lista   
-        except Exception as e:
-            messagebox.showerror("Erro de Carga", f"Não foi possível recarregar os tipos de vegetais.\n{e}",
-                                 parent=self)   
+    def _exibir_tipos_vegetais(self, tipos_lista):
+        self.view.tipo_combobox['values'] = tipos_lista   
 
     def open_tipos_modal(self):
         """
@@ -62,7 +84,8 @@ class PainelCadastroVegetais(BasePanel):
         A função _carregar_tipos_vegetais é passada como callback para ser executada
         quando o modal for fechado, garantindo que o combobox seja atualizado.
         """
-        modal = TiposVegetaisController(self, on_close_callback=self._carregar_tipos_vegetais)   
+        modal = TiposVegetaisController(self, on_close_callback=self._carregar_tipos_vegetais,
+                                        usuario=self._usuario_logado())   
         modal.show()   
 
     def save_item(self):
@@ -75,21 +98,22 @@ class PainelCadastroVegetais(BasePanel):
 
         try:
                                                                     
-            df_tipo = GenericRepository.read_table_to_dataframe("tipos_vegetais", where_conditions={'nome': tipo_nome})   
-            if df_tipo.empty:   
+            id_tipo = ReferenceCache.id_for('tipos_vegetais', tipo_nome)
+            if id_tipo is None:   
                 messagebox.showerror("Erro de Dados", f"O tipo '{tipo_nome}' não foi encontrado.", parent=self)   
                 return
 
-            id_tipo = int(df_tipo.iloc[0]['id'])
-
             data = {'nome': nome, 'id_tipo': id_tipo}   
 
             if self.selected_item_id is None:   
-                GenericRepository.write_dataframe_to_table(pd.DataFrame([data]), "vegetais")   
+                GenericRepository.insert_row("vegetais", data, audit=(
+                    self._usuario_logado(), f"Vegetal '{nome}' cadastrado com o tipo '{tipo_nome}'."))
                 messagebox.showinfo("Sucesso", "Vegetal cadastrado!", parent=self)   
             else:   
                                                                       
-                GenericRepository.update_table("vegetais", data, {'id': self.selected_item_id})   
+                GenericRepository.update_table("vegetais", data, {'id': self.selected_item_id}, audit=(
+                    self._usuario_logado(),
+                    f"Vegetal ID {self.selected_item_id} atualizado para '{nome}' (tipo '{tipo_nome}')."))
                 messagebox.showinfo("Sucesso", "Vegetal atualizado!", parent=self)   
 
             self.clear_form()   
@@ -107,7 +131,8 @@ class PainelCadastroVegetais(BasePanel):
                                parent=self):   
             try:
                                                                       
-                GenericRepository.delete_from_table("vegetais", {'id': self.selected_item_id})   
+                GenericRepository.delete_from_table("vegetais", {'id': self.selected_item_id}, audit=(
+                    self._usuario_logado(), f"Vegetal ID {self.selected_item_id} excluído."))
                 messagebox.showinfo("Sucesso", "Vegetal excluído!", parent=self)   
                 self.clear_form()   
                 self._carregar_dados()   
@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
 import config
 from panels.base_panel import BasePanel   
 from persistencia.repository import GenericRepository   
 from persistencia.data_service import DataService   
 from .painel_gestao_gatos_view import GestaoGatosView
+from .virtual_treeview import KeysetPageSource
 
 class PainelGestaoGatos(BasePanel):   
     """Controller consolidado para todas as operações da tabela especie_gatos."""
@@ -29,22 +29,25 @@ class PainelGestaoGatos(BasePanel):
 
         self.view = GestaoGatosView(self, controller=self)   
         self.view.pack(fill="both", expand=True)   
+        self.page_in_background(self.view.tree, key='carregar_dados_mais')
         self.carregar_dados()   
 
     def carregar_dados(self):
-        """(READ) Busca os dados e instrui a View a exibi-los."""
-        try:
-            for item in self.view.tree.get_children():   
-                self.view.tree.delete(item)   
-                                             
-            df = GenericRepository.read_table_to_dataframe("especie_gatos")   
-            if not df.empty:   
-                                                                                        
-                for _, row in df.iterrows():   
-                    self.view.tree.insert("", "end", values=list(row))   
-            self.limpar_form()   
-        except Exception as e:
-            messagebox.showerror("Erro de Leitura", f"Não foi possível ler os dados: {e}", parent=self)   
+        """(READ) Busca os dados em segundo plano e instrui a View a exibi-los."""
+        source = KeysetPageSource(
+            lambda after, size: GenericRepository.read_table_page("especie_gatos", size, after), auto_fetch=False)
+        self.run_in_background(
+            source.fetch_more, key='carregar_dados',
+            on_success=lambda _: self._exibir_dados(source),
+            on_error=lambda e: messagebox.showerror("Erro de Leitura", f"Não foi possível ler os dados: {e}",
+                                                    parent=self))
+
+    def reload(self):
+        self.carregar_dados()
+
+    def _exibir_dados(self, source):
+        self.view.tree.set_data_source(source)
+        self.limpar_form()   
 
     def on_item_select(self, event=None):
         """Atualiza o estado do Controller quando um item é selecionado na View."""
@@ -79,7 +82,8 @@ class PainelGestaoGatos(BasePanel):
                 'temperamento': self.temperamento_var.get().strip()}
         try:
                                              
-            GenericRepository.write_dataframe_to_table(pd.DataFrame([data]), "especie_gatos")
+            GenericRepository.insert_row("especie_gatos", data,
+                                         audit=(self._usuario_logado(), f"Espécie '{nome}' cadastrada."))
             messagebox.showinfo("Sucesso", "Nova espécie inserida com sucesso!", parent=self)
             self.carregar_dados()   
         except Exception as e:
@@ -96,7 +100,10 @@ class PainelGestaoGatos(BasePanel):
         try:
                                                           
             GenericRepository.update_table("especie_gatos", update_values=update_values,
-                                           where_conditions={'id': self.selected_item_id})   
+                                           where_conditions={'id': self.selected_item_id},
+                                           audit=(self._usuario_logado(),
+                                                  f"Espécie ID {self.selected_item_id} atualizada "
+                                                  f"('{update_values['nome_especie']}')."))
             messagebox.showinfo("Sucesso", "Espécie atualizada com sucesso!", parent=self)   
             self.carregar_dados()   
         except Exception as e:
@@ -112,7 +119,9 @@ class PainelGestaoGatos(BasePanel):
             return   
         try:
                                                           
-            GenericRepository.delete_from_table("especie_gatos", where_conditions={'id': self.selected_item_id})   
+            GenericRepository.delete_from_table("especie_gatos", where_conditions={'id': self.selected_item_id},
+                                                audit=(self._usuario_logado(),
+                                                       f"Espécie ID {self.selected_item_id} excluída."))
             messagebox.showinfo("Sucesso", "Espécie excluída com sucesso!", parent=self)   
             self.carregar_dados()   
         except Exception as e:
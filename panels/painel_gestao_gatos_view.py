@@ -1,6 +1,7 @@
                                     
 import tkinter as tk
 from tkinter import ttk
+from .virtual_treeview import VirtualTreeview
 
 class GestaoGatosView(ttk.Frame):
     """A View consolidada para a gestão de espécies de gatos."""
@@ -67,7 +68,7 @@ class GestaoGatosView(ttk.Frame):
         parent.columnconfigure(0, weight=1)
 
         columns = ('id', 'nome_especie', 'pais_origem', 'temperamento')
-        self.tree = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse')
+        self.tree = VirtualTreeview(parent, columns=columns, show='headings', selectmode='browse')
         for col in columns: self.tree.heading(col, text=col.replace('_', ' ').title())
         self.tree.column('id', width=40, anchor='center')
         self.tree.column('nome_especie', width=150)
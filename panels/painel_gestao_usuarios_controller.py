@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
 import config
 from panels.base_panel import BasePanel
 from persistencia.repository import GenericRepository
 from persistencia.auth import hash_password                              
 from .painel_gestao_usuarios_view import GestaoUsuariosView
+from .virtual_treeview import KeysetPageSource
 
 PERFIS_DE_ACESSO = [
     'Administrador Global',
@@ -43,32 +43,26 @@ class PainelGestaoUsuariosController(BasePanel):
 
         self.view = GestaoUsuariosView(self, controller=self, perfis_acesso=PERFIS_DE_ACESSO)
         self.view.pack(fill="both", expand=True)
+        self.page_in_background(self.view.tree, key='carregar_dados_mais')
         self.carregar_dados()
 
     def carregar_dados(self):
-        """(READ) Busca os usuários e instrui a View a exibi-los."""
-        try:
-                                                
-            for item in self.view.tree.get_children():
-                self.view.tree.delete(item)
-
-            df_users = GenericRepository.read_table_to_dataframe("usuarios")
-
-            if 'senha_criptografada' in df_users.columns:
-                df_users = df_users.drop(columns=['senha_criptografada'])
-
-            if not df_users.empty:
-                                             
-                for _, row in df_users.iterrows():
-                                                                                    
-                    self.view.tree.insert("", "end", values=(
-                        row['login_usuario'],
-                        row['nome_completo'],
-                        row['tipo_acesso']
-                    ))
-            self.limpar_form()                             
-        except Exception as e:
-            messagebox.showerror("Erro de Leitura", f"Não foi possível carregar os usuários: {e}", parent=self)
+        """(READ) Busca os usuários em segundo plano e instrui a View a exibi-los."""
+        source = KeysetPageSource(lambda after, size: GenericRepository.read_table_page(
+            "usuarios", size, after, order_by='login_usuario', key_column='login_usuario',
+            columns=['login_usuario', 'nome_completo', 'tipo_acesso']), auto_fetch=False)
+        self.run_in_background(
+            source.fetch_more, key='carregar_dados',
+            on_success=lambda _: self._exibir_dados(source),
+            on_error=lambda e: messagebox.showerror("Erro de Leitura", f"Não foi possível carregar os usuários: {e}",
+                                                    parent=self))
+
+    def reload(self):
+        self.carregar_dados()
+
+    def _exibir_dados(self, source):
+        self.view.tree.set_data_source(source)
+        self.limpar_form()                             
 
     def on_item_select(self, event=None):
         """Atualiza o formulário quando um usuário é selecionado na Treeview."""
@@ -127,7 +121,9 @@ class PainelGestaoUsuariosController(BasePanel):
                     update_values['senha_criptografada'] = hashed_pw
 
                 where_conditions = {'login_usuario': self.selected_item_login}
-                GenericRepository.update_table("usuarios", update_values, where_conditions)
+                acao = f"Usuário '{login}' atualizado (perfil '{tipo_acesso}'" + (", nova senha)." if nova_senha else ").")
+                GenericRepository.update_table("usuarios", update_values, where_conditions,
+                                               audit=(self._usuario_logado(), acao))
                 messagebox.showinfo("Sucesso", f"Usuário '{login}' atualizado com sucesso!", parent=self)
 
             else:
@@ -136,13 +132,12 @@ class PainelGestaoUsuariosController(BasePanel):
                     return
 
                 hashed_pw = hash_password(nova_senha)
-                df_data = pd.DataFrame([{
+                GenericRepository.insert_row("usuarios", {
                     'login_usuario': login,
                     'senha_criptografada': hashed_pw,
                     'nome_completo': nome,
                     'tipo_acesso': tipo_acesso
-                }])
-                GenericRepository.write_dataframe_to_table(df_data, "usuarios")
+                }, audit=(self._usuario_logado(), f"Usuário '{login}' criado com o perfil '{tipo_acesso}'."))
                 messagebox.showinfo("Sucesso", f"Usuário '{login}' criado com sucesso!", parent=self)
 
             self.carregar_dados()                                   
@@ -163,7 +158,9 @@ class PainelGestaoUsuariosController(BasePanel):
         if messagebox.askyesno("Confirmar Exclusão", f"Tem certeza que deseja excluir o usuário '{self.selected_item_login}'?\nEsta ação não pode ser desfeita.", icon='warning', parent=self):
             try:
                 where_conditions = {'login_usuario': self.selected_item_login}
-                GenericRepository.delete_from_table("usuarios", where_conditions)
+                GenericRepository.delete_from_table("usuarios", where_conditions,
+                                                    audit=(self._usuario_logado(),
+                                                           f"Usuário '{self.selected_item_login}' excluído."))
                 messagebox.showinfo("Sucesso", f"Usuário '{self.selected_item_login}' excluído com sucesso!", parent=self)
                 self.carregar_dados()                                   
             except Exception as e:
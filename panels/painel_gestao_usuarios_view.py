@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from .virtual_treeview import VirtualTreeview
 
 class GestaoUsuariosView(ttk.Frame):
     """A View para a gestão de usuários."""
@@ -77,7 +78,7 @@ class GestaoUsuariosView(ttk.Frame):
         parent.columnconfigure(0, weight=1)
 
         columns = ('login_usuario', 'nome_completo', 'tipo_acesso')
-        self.tree = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse')
+        self.tree = VirtualTreeview(parent, columns=columns, show='headings', selectmode='browse')
 
         self.tree.heading('login_usuario', text='Login')
         self.tree.heading('nome_completo', text='Nome Completo')
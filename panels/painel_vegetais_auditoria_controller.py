@@ -1,13 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pandas as pd
 import logging
+from datetime import datetime, timedelta
 import config
 from .base_panel import BasePanel   
 from persistencia.repository import GenericRepository   
+from persistencia.reference_cache import ReferenceCache
 from persistencia.data_service import DataService   
 from modals.tipos_vegetais_controller import TiposVegetaisController   
 from .painel_vegetais_auditoria_view import VegetaisAuditoriaView
+from .virtual_treeview import KeysetPageSource
+from .row_adapter import dataframe_to_rows, datetime_formatter
 
 class PainelVegetaisAuditoria(BasePanel):   
     """Controller consolidado para a gestão de Vegetais e visualização de Auditoria."""
@@ -20,6 +23,13 @@ class PainelVegetaisAuditoria(BasePanel):
         self.nome_var = tk.StringVar()
         self.tipo_var = tk.StringVar()
         self.novo_tipo_trans_var = tk.StringVar()
+        self.log_usuario_var = tk.StringVar()
+        self.log_data_inicio_var = tk.StringVar()
+        self.log_data_fim_var = tk.StringVar()
+        self.log_busca_var = tk.StringVar()
+        self._log_filtros = {}
+        self._log_busca = ""
+        self._log_source = None
         super().__init__(parent, app_controller, **kwargs)
 
     def create_widgets(self):
@@ -30,6 +40,7 @@ class PainelVegetaisAuditoria(BasePanel):
 
         self.view = VegetaisAuditoriaView(self, controller=self)   
         self.view.pack(fill="both", expand=True)   
+        self.page_in_background(self.view.tree_vegetais, key='vegetais_mais')
         self.carregar_dados()   
 
     def carregar_dados(self):
@@ -39,51 +50,128 @@ class PainelVegetaisAuditoria(BasePanel):
         self._carregar_log()
         self.clear_form()
 
+    def reload(self):
+        """Recarrega as listas sem limpar o formulário (ex.: ao voltar para o painel)."""
+        self._carregar_vegetais()
+        self._carregar_tipos_vegetais()
+        self._carregar_log()
+
     def _carregar_vegetais(self):
-        try:
-            for item in self.view.tree_vegetais.get_children():   
-                self.view.tree_vegetais.delete(item)   
-                                                                             
-            df_vegetais = GenericRepository.read_vegetais_com_tipo()   
-            if not df_vegetais.empty:   
-                for _, row in df_vegetais.iterrows():
-                    self.view.tree_vegetais.insert("", "end", values=list(row))   
-        except Exception as e:
-            messagebox.showerror("Erro de Carga", f"Não foi possível carregar a lista de vegetais.\n{e}", parent=self)   
+        source = KeysetPageSource(
+            lambda after, size: GenericRepository.read_vegetais_com_tipo_page(size, after), auto_fetch=False)
+        self.run_in_background(
+            source.fetch_more, key='vegetais',
+            on_success=lambda _: self.view.tree_vegetais.set_data_source(source),
+            on_error=lambda e: messagebox.showerror(
+                "Erro de Carga", f"Não foi possível carregar a lista de vegetais.\n{e}", parent=self))
 
     def _carregar_tipos_vegetais(self):
-        try:
-                                                                     
-            df_tipos = GenericRepository.read_table_to_dataframe("tipos_vegetais")   
+        self.run_in_background(
+            ReferenceCache.names, 'tipos_vegetais', key='tipos_vegetais',
+            on_success=self._exibir_tipos_vegetais,
+            on_error=lambda e: messagebox.showerror(
+                "Erro de Carga", f"Não foi possível recarregar os tipos de vegetais.\n{e}", parent=self))
 
-            tipos_lista = sorted(df_tipos['nome'].tolist()) if not df_tipos.empty else []   
-            self.view.tipo_combobox['values'] = tipos_lista   
-            self.view.trans_tipo_combo['values'] = tipos_lista   
-        except Exception as e:
-            messagebox.showerror("Erro de Carga", f"Não foi possível recarregar os tipos de vegetais.\n{e}",
-                                 parent=self)   
+    def _exibir_tipos_vegetais(self, tipos_lista):
+        self.view.tipo_combobox['values'] = tipos_lista   
+        self.view.trans_tipo_combo['values'] = tipos_lista   
 
     def _carregar_log(self):
+        """
+        Carrega as alterações mais recentes (ou, com termo de busca, as mais relevantes); as
+        páginas seguintes vêm sob demanda pelo botão abaixo da tabela.
+        """
+        filtros = dict(self._log_filtros)
+        busca = self._log_busca
+        if busca:
+            fetch_page = lambda after, size: GenericRepository.search_log_alteracoes(busca, size, after, **filtros)
+        else:
+            fetch_page = lambda after, size: GenericRepository.read_log_alteracoes_page(size, after, **filtros)
+        source = KeysetPageSource(fetch_page, page_size=config.AUDIT_LOG_PAGE_SIZE, to_rows=self._log_para_linhas,
+                                  auto_fetch=False)
+        self._log_source = source
+        self.view.log_mais_antigos_button.configure(
+            state="disabled", text="Carregar mais resultados" if busca else "Carregar mais antigos")
+        self.run_in_background(source.fetch_more, key='log',
+                               on_success=lambda _: self._exibir_log(source),
+                               on_error=self._erro_carga_log)
+
+    def carregar_log_mais_antigos(self):
+        """Busca a próxima página (mais antiga) da trilha de auditoria."""
+        source = self._log_source
+        if source is None or not source.has_more:
+            return
+        self.view.log_mais_antigos_button.configure(state="disabled")
+        self.run_in_background(source.fetch_more, key='log',
+                               on_success=lambda _: self._exibir_log(source),
+                               on_error=self._erro_carga_log)
+
+    def _exibir_log(self, source):
+        if source is not self._log_source:
+            return
+        if self.view.tree_log.get_data_source() is source:
+            self.view.tree_log.refresh()
+        else:
+            self.view.tree_log.set_data_source(source)
+        if self._log_busca:
+            status = f"{len(source)} resultado(s) para '{self._log_busca}'" + (" — há mais" if source.has_more else "")
+        else:
+            status = f"{len(source)} registro(s) exibido(s)" + (" — há registros mais antigos" if source.has_more else "")
+        self.view.log_status_label.configure(text=status)
+        self.view.log_mais_antigos_button.configure(state="normal" if source.has_more else "disabled")
+
+    def filtrar_log(self):
+        """Aplica a busca textual e os filtros de usuário e período (dd/mm/aaaa, datas inclusivas) ao log."""
         try:
-            for item in self.view.tree_log.get_children(): self.view.tree_log.delete(item)   
-                                                                                                   
-            df = GenericRepository.read_table_to_dataframe("log_alteracoes")   
-            if not df.empty:   
-
-                df['timestamp'] = pd.to_datetime(df['timestamp'])   
-                df_sorted = df.sort_values(by='timestamp', ascending=False)   
-                for _, row in df_sorted.iterrows():   
-                                                       
-                    row['timestamp'] = row['timestamp'].strftime('%d/%m/%Y %H:%M:%S')   
-                    self.view.tree_log.insert("", "end", values=list(row))   
-        except Exception as e:
-            logging.getLogger("main_app").error(f"Falha ao carregar log de auditoria: {e}", exc_info=True)   
-            messagebox.showerror("Erro de Carga", f"Não foi possível carregar o log de auditoria.\nDetalhe: {e}",
-                                 parent=self)   
+            data_inicio = self._ler_data(self.log_data_inicio_var.get())
+            data_fim = self._ler_data(self.log_data_fim_var.get())
+        except ValueError:
+            messagebox.showerror("Filtro Inválido", "Informe as datas no formato dd/mm/aaaa.", parent=self)
+            return
+        filtros = {}
+        if self.log_usuario_var.get().strip():
+            filtros['login_usuario'] = self.log_usuario_var.get().strip()
+        if data_inicio is not None:
+            filtros['data_inicio'] = data_inicio
+        if data_fim is not None:
+            filtros['data_fim'] = data_fim + timedelta(days=1)
+        self._log_filtros = filtros
+        self._log_busca = self.log_busca_var.get().strip()
+        self._carregar_log()
+
+    def limpar_filtro_log(self):
+        self.log_usuario_var.set("")
+        self.log_data_inicio_var.set("")
+        self.log_data_fim_var.set("")
+        self.log_busca_var.set("")
+        self._log_filtros = {}
+        self._log_busca = ""
+        self._carregar_log()
+
+    @staticmethod
+    def _ler_data(texto):
+        texto = texto.strip()
+        return datetime.strptime(texto, '%d/%m/%Y') if texto else None
+
+    def _erro_carga_log(self, e):
+        logging.getLogger("main_app").error(f"Falha ao carregar log de auditoria: {e}", exc_info=e)   
+        if self._log_source is not None and self._log_source.has_more:
+            self.view.log_mais_antigos_button.configure(state="normal")
+        messagebox.showerror("Erro de Carga", f"Não foi possível carregar o log de auditoria.\nDetalhe: {e}",
+                             parent=self)   
+
+    @staticmethod
+    def _log_para_linhas(df):
+        """
+        Converte uma página do log de auditoria em linhas para exibição. O repositório já
+        entrega 'timestamp' como datetime64; a coluna é formatada de uma vez (dt.strftime).
+        """
+        return dataframe_to_rows(df, formatters={'timestamp': datetime_formatter()})
 
     def open_tipos_modal(self):
         """Abre a janela de gestão de tipos e define o recarregamento como callback."""
-        modal = TiposVegetaisController(self, on_close_callback=self._carregar_tipos_vegetais)   
+        modal = TiposVegetaisController(self, on_close_callback=self._carregar_tipos_vegetais,
+                                        usuario=self._usuario_logado())   
         modal.show()   
 
     def save_item(self):
@@ -95,21 +183,22 @@ class PainelVegetaisAuditoria(BasePanel):
             return
         try:
                                                                     
-            df_tipo = GenericRepository.read_table_to_dataframe("tipos_vegetais", where_conditions={'nome': tipo_nome})   
-            if df_tipo.empty:
+            id_tipo = ReferenceCache.id_for('tipos_vegetais', tipo_nome)
+            if id_tipo is None:
                 messagebox.showerror("Erro de Dados", f"O tipo '{tipo_nome}' não foi encontrado.", parent=self)   
                 return
 
-            id_tipo = int(df_tipo.iloc[0]['id'])
-
             data = {'nome': nome, 'id_tipo': id_tipo}   
 
             if self.selected_item_id is None:
-                GenericRepository.write_dataframe_to_table(pd.DataFrame([data]), "vegetais")   
+                GenericRepository.insert_row("vegetais", data, audit=(
+                    self._usuario_logado(), f"Vegetal '{nome}' cadastrado com o tipo '{tipo_nome}'."))
                 messagebox.showinfo("Sucesso", "Vegetal cadastrado!", parent=self)   
             else:
                                                                       
-                GenericRepository.update_table("vegetais", data, {'id': self.selected_item_id})   
+                GenericRepository.update_table("vegetais", data, {'id': self.selected_item_id}, audit=(
+                    self._usuario_logado(),
+                    f"Vegetal ID {self.selected_item_id} atualizado para '{nome}' (tipo '{tipo_nome}')."))
                 messagebox.showinfo("Sucesso", "Vegetal atualizado!", parent=self)   
             self.carregar_dados()   
         except Exception as e:
@@ -124,7 +213,8 @@ class PainelVegetaisAuditoria(BasePanel):
                                  parent=self):   
             try:
                                                                       
-                GenericRepository.delete_from_table("vegetais", {'id': self.selected_item_id})   
+                GenericRepository.delete_from_table("vegetais", {'id': self.selected_item_id}, audit=(
+                    self._usuario_logado(), f"Vegetal ID {self.selected_item_id} excluído."))
                 messagebox.showinfo("Sucesso", "Vegetal excluído!", parent=self)   
                 self.carregar_dados()   
             except Exception as e:
@@ -138,13 +228,19 @@ class PainelVegetaisAuditoria(BasePanel):
         self.tipo_var.set("")   
         self.novo_tipo_trans_var.set("")   
         if self.view.tree_vegetais.selection():   
-            self.view.tree_vegetais.selection_remove(self.view.tree_vegetais.selection()[0])   
+            self.view.tree_vegetais.selection_remove(*self.view.tree_vegetais.selection())
         self.view.nome_entry.focus()   
 
     def on_vegetal_select(self, event=None):
-        """Preenche o formulário quando um vegetal é selecionado na tabela."""
+        """Preenche o formulário quando um único vegetal é selecionado na tabela."""
         selected_items = self.view.tree_vegetais.selection()   
         if not selected_items: return   
+        if len(selected_items) > 1:
+            # Seleção múltipla serve apenas à reclassificação em lote; o formulário fica vazio.
+            self.selected_item_id = None
+            self.nome_var.set("")
+            self.tipo_var.set("")
+            return
         item = self.view.tree_vegetais.item(selected_items[0])   
         values = item['values']   
                                                               
@@ -153,27 +249,40 @@ class PainelVegetaisAuditoria(BasePanel):
         self.tipo_var.set(values[2])          
 
     def executar_transacao_reclassify(self):
-        """Chama o DataService para reclassificar um vegetal de forma atômica e auditada."""
-        if self.selected_item_id is None:   
-            messagebox.showwarning("Atenção", "Selecione um vegetal na tabela para reclassificar.", parent=self)
+        """Chama o DataService para reclassificar os vegetais selecionados em uma transação atômica e auditada."""
+        selecionados = self.view.tree_vegetais.selection()
+        if not selecionados:
+            messagebox.showwarning("Atenção", "Selecione um ou mais vegetais na tabela para reclassificar.", parent=self)
             return   
 
-        vegetal_nome = self.nome_var.get()
         novo_tipo = self.novo_tipo_trans_var.get()
 
         if not novo_tipo:   
             messagebox.showwarning("Validação", "Selecione o novo tipo para a transação.", parent=self)   
             return
 
-        usuario_logado = self.app.get_current_user()['username']   
-        msg = f"Deseja reclassificar '{vegetal_nome}' para o tipo '{novo_tipo}'?\n\nEsta ação será registrada na trilha de auditoria."   
+        ids_vegetais = [int(iid) for iid in selecionados]
+        if len(ids_vegetais) == 1:
+            alvo = f"'{self.view.tree_vegetais.item(selecionados[0], 'values')[1]}'"
+        else:
+            alvo = f"{len(ids_vegetais)} vegetais"
+        msg = f"Deseja reclassificar {alvo} para o tipo '{novo_tipo}'?\n\nEsta ação será registrada na trilha de auditoria."   
         if not messagebox.askyesno("Confirmar Transação", msg, icon='warning', parent=self):   
             return
 
-        sucesso, mensagem = DataService.reclassificar_vegetal_e_logar(vegetal_nome, novo_tipo, usuario_logado)   
+        sucesso, mensagem, resultados = DataService.reclassificar_vegetais_e_logar(
+            ids_vegetais, novo_tipo, self._usuario_logado())
+
+        ignorados = {id_vegetal: status for id_vegetal, status in resultados.items()
+                     if status != DataService.RECLASSIFICADO}
+        if ignorados:
+            detalhes = "\n".join(f"• ID {id_vegetal}: {status}" for id_vegetal, status in list(ignorados.items())[:10])
+            if len(ignorados) > 10:
+                detalhes += f"\n• ... e mais {len(ignorados) - 10}"
+            mensagem += f"\n\nNão alterados:\n{detalhes}"
 
         if sucesso:   
             messagebox.showinfo("Sucesso", mensagem, parent=self)   
             self.carregar_dados()   
         else:   
-            messagebox.showerror("Falha na Transação", mensagem, parent=self)   
\ No newline at end of file
+            messagebox.showerror("Falha na Transação", mensagem, parent=self)
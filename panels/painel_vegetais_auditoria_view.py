@@ -1,6 +1,7 @@
                                           
 import tkinter as tk
 from tkinter import ttk
+from .virtual_treeview import VirtualTreeview
 
 class VegetaisAuditoriaView(ttk.Frame):
     """
@@ -77,7 +78,8 @@ class VegetaisAuditoriaView(ttk.Frame):
         parent.rowconfigure(0, weight=1)
         parent.columnconfigure(0, weight=1)
         columns = ('id', 'nome', 'tipo')
-        self.tree_vegetais = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse')
+        # 'extended': Ctrl/Shift+clique seleciona vários vegetais para a reclassificação em lote.
+        self.tree_vegetais = VirtualTreeview(parent, columns=columns, show='headings', selectmode='extended')
 
         self.tree_vegetais.heading('id', text='ID')
         self.tree_vegetais.heading('nome', text='Nome do Vegetal')
@@ -95,10 +97,31 @@ class VegetaisAuditoriaView(ttk.Frame):
         self.tree_vegetais.bind("<<TreeviewSelect>>", self.controller.on_vegetal_select)
 
     def _create_table_log(self, parent):
-        parent.rowconfigure(0, weight=1)
+        parent.rowconfigure(2, weight=1)
         parent.columnconfigure(0, weight=1)
+
+        filter_frame = ttk.Frame(parent)
+        filter_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+        ttk.Label(filter_frame, text="Usuário:").pack(side="left")
+        ttk.Entry(filter_frame, textvariable=self.controller.log_usuario_var, width=14).pack(side="left", padx=(2, 8))
+        ttk.Label(filter_frame, text="De:").pack(side="left")
+        ttk.Entry(filter_frame, textvariable=self.controller.log_data_inicio_var, width=10).pack(side="left", padx=(2, 8))
+        ttk.Label(filter_frame, text="Até:").pack(side="left")
+        ttk.Entry(filter_frame, textvariable=self.controller.log_data_fim_var, width=10).pack(side="left", padx=(2, 8))
+        ttk.Button(filter_frame, text="Filtrar", command=self.controller.filtrar_log, width=8).pack(side="left")
+        ttk.Button(filter_frame, text="Limpar", command=self.controller.limpar_filtro_log, width=8,
+                   style="Secondary.TButton").pack(side="left", padx=(5, 0))
+
+        search_frame = ttk.Frame(parent)
+        search_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 5))
+        ttk.Label(search_frame, text="Buscar na ação:").pack(side="left")
+        self.log_busca_entry = ttk.Entry(search_frame, textvariable=self.controller.log_busca_var)
+        self.log_busca_entry.pack(side="left", fill="x", expand=True, padx=(2, 8))
+        self.log_busca_entry.bind("<Return>", lambda e: self.controller.filtrar_log())
+        ttk.Button(search_frame, text="🔍 Buscar", command=self.controller.filtrar_log, width=10).pack(side="left")
+
         columns = ('id', 'timestamp', 'login_usuario', 'acao')
-        self.tree_log = ttk.Treeview(parent, columns=columns, show='headings', selectmode='browse')
+        self.tree_log = VirtualTreeview(parent, columns=columns, show='headings', selectmode='browse')
         self.tree_log.heading('id', text='ID')
         self.tree_log.heading('timestamp', text='Data/Hora')
         self.tree_log.heading('login_usuario', text='Usuário')
@@ -112,12 +135,21 @@ class VegetaisAuditoriaView(ttk.Frame):
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.tree_log.yview)
         self.tree_log.configure(yscrollcommand=scrollbar.set)
 
-        self.tree_log.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree_log.grid(row=2, column=0, sticky="nsew")
+        scrollbar.grid(row=2, column=1, sticky="ns")
+
+        footer_frame = ttk.Frame(parent)
+        footer_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+        self.log_status_label = ttk.Label(footer_frame, text="")
+        self.log_status_label.pack(side="left")
+        self.log_mais_antigos_button = ttk.Button(footer_frame, text="Carregar mais antigos",
+                                                  command=self.controller.carregar_log_mais_antigos,
+                                                  state="disabled")
+        self.log_mais_antigos_button.pack(side="right")
 
     def _create_transaction_widgets(self, parent):
         parent.columnconfigure(1, weight=1)
-        ttk.Label(parent, text="Reclassificar vegetal selecionado para o tipo:").grid(row=0, column=0, sticky="w",
+        ttk.Label(parent, text="Reclassificar vegetais selecionados para o tipo:").grid(row=0, column=0, sticky="w",
                                                                                       padx=5)
 
         self.trans_tipo_combo = ttk.Combobox(parent, textvariable=self.controller.novo_tipo_trans_var, state="readonly")
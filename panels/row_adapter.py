@@ -0,0 +1,36 @@
+import pandas as pd
+
+DISPLAY_DATETIME_FORMAT = '%d/%m/%Y %H:%M:%S'
+
+def dataframe_to_rows(df: pd.DataFrame, formatters: dict = None, na_value="") -> list:
+    """
+    Converte um DataFrame em tuplas prontas para a Treeview, coluna a coluna.
+
+    Cada formatador recebe a coluna inteira (Series) e devolve a coluna formatada, de modo
+    que datas e números são convertidos em uma operação vetorizada, e não célula a célula.
+    Valores ausentes (None, NaN, NaT) viram 'na_value'. As colunas são extraídas com
+    tolist() (tipos nativos do Python, sem Series por linha como em iterrows()) e unidas
+    por zip.
+    """
+    if df is None or df.empty:
+        return []
+    formatters = formatters or {}
+    columns = []
+    for name in df.columns:
+        column = df[name]
+        formatter = formatters.get(name)
+        if formatter is not None:
+            column = formatter(column)
+        missing = column.isna()
+        if missing.any():
+            column = column.astype(object).where(~missing, na_value)
+        columns.append(column.tolist())
+    return list(zip(*columns))
+
+def datetime_formatter(fmt: str = DISPLAY_DATETIME_FORMAT):
+    """Formatador de datas: aceita colunas datetime ou texto ISO 8601 e aplica dt.strftime."""
+    def format_column(column: pd.Series) -> pd.Series:
+        if not pd.api.types.is_datetime64_any_dtype(column):
+            column = pd.to_datetime(column, format='ISO8601')
+        return column.dt.strftime(fmt)
+    return format_column
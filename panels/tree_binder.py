@@ -0,0 +1,230 @@
+import bisect
+import tkinter as tk
+from tkinter import ttk
+
+# Itens excluídos/inseridos por chamada ao Tk durante uma carga incremental.
+DELETE_CHUNK_SIZE = 500
+BULK_INSERT_CHUNK_SIZE = 500
+# Linhas analisadas entre dois passos do gerador enquanto a diferença é calculada.
+PREPARE_CHUNK_SIZE = 2000
+
+_BULK_INSERT_PROC = "::treeview_bulk_insert"
+_BULK_INSERT_SCRIPT = """
+proc ::treeview_bulk_insert {tree parent items} {
+    foreach {iid values} $items {
+        $tree insert $parent end -id $iid -values $values
+    }
+}
+"""
+
+def bulk_insert(tree, items, parent: str = ""):
+    """
+    Insere os pares (iid, valores) no fim de 'parent' com uma única chamada ao Tcl.
+
+    Em vez de um tree.insert() por linha (uma travessia Python -> Tcl e uma conversão de
+    opções cada), os pares seguem como uma única lista Tcl para um procedimento que faz o
+    laço do lado do Tcl. A lista é montada pelo próprio _tkinter, elemento a elemento, então
+    espaços, chaves, aspas e barras nos valores não precisam de escape.
+    """
+    flat = []
+    for iid, values in items:
+        flat.append(iid)
+        flat.append(tuple(values))
+    if not flat:
+        return
+    try:
+        tree.tk.call(_BULK_INSERT_PROC, tree._w, parent, tuple(flat))
+    except tk.TclError as e:
+        # O procedimento é definido uma vez por interpretador, na primeira chamada.
+        if not str(e).startswith('invalid command name') or _BULK_INSERT_PROC not in str(e):
+            raise
+        tree.tk.eval(_BULK_INSERT_SCRIPT)
+        tree.tk.call(_BULK_INSERT_PROC, tree._w, parent, tuple(flat))
+
+class TreeviewBinder:
+    """
+    Mantém uma ttk.Treeview sincronizada com uma lista de linhas sem reconstruí-la.
+
+    Cada linha vira um item cujo iid é o valor da coluna 'key_index' (normalmente a PK).
+    A cada bind_rows() as linhas recebidas são comparadas com as exibidas e só as
+    diferenças chegam ao Tk: exclusões, alterações de valores, inserções e mudanças de
+    posição. Os itens que já estão na ordem relativa correta (a maior subsequência
+    crescente) não são movidos. Assim, salvar um registro em uma tabela de 50 mil linhas
+    altera um único item. Como os iids não mudam, a seleção dos itens que continuam na
+    lista é preservada; com keep_view=True a primeira linha visível continua no topo.
+
+    Os comandos são enviados pelos métodos de ttk.Treeview, ignorando sobrescritas da
+    subclasse, o que permite à VirtualTreeview usar o binder na sua janela de linhas.
+    """
+
+    def __init__(self, tree, key_index: int = 0, keep_view: bool = True):
+        self.tree = tree
+        self.key_index = key_index
+        self.keep_view = keep_view
+        self._values = {}   # iid -> valores exibidos, na ordem atual da Treeview
+
+    def bind_rows(self, rows) -> dict:
+        """
+        Aplica as linhas (iterável de sequências) à Treeview e retorna a contagem de
+        operações: {'inserted', 'updated', 'deleted', 'moved'}.
+        """
+        steps = self.iter_apply(rows)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    def iter_apply(self, rows):
+        """
+        Versão incremental de bind_rows(): gerador que aplica as diferenças aos poucos e
+        produz (processadas, total) a cada passo, para ser consumido em fatias de tempo
+        (BasePanel.populate_in_slices). O cálculo da diferença também é feito em passos de
+        PREPARE_CHUNK_SIZE linhas, produzindo (0, total) até a aplicação começar. Se for
+        fechado no meio, o binder se ressincroniza com os itens realmente exibidos e a
+        próxima carga calcula a diferença a partir deles.
+        """
+        tree = self.tree
+        preparing = (0, len(rows) if hasattr(rows, '__len__') else 0)
+        new_values = {}
+        for count, row in enumerate(rows, start=1):
+            row = tuple(row)
+            iid = str(row[self.key_index])
+            if iid in new_values:
+                raise ValueError(f"Chave duplicada na coluna {self.key_index} da Treeview: '{iid}'.")
+            new_values[iid] = row
+            if count % PREPARE_CHUNK_SIZE == 0:
+                yield preparing
+
+        anchor = self._first_visible() if self.keep_view else None
+        anchor_index = ttk.Treeview.index(tree, anchor) if anchor else None
+
+        deleted, kept = [], []
+        for count, iid in enumerate(self._values, start=1):
+            (kept if iid in new_values else deleted).append(iid)
+            if count % PREPARE_CHUNK_SIZE == 0:
+                yield preparing
+        stable = set()
+        yield from self._iter_stable_keys(kept, new_values, stable, preparing)
+
+        stats = {'inserted': 0, 'updated': 0, 'deleted': 0, 'moved': 0}
+        total = len(deleted) + len(new_values)
+        shown = dict(self._values)
+        completed = False
+        try:
+            for start in range(0, len(deleted), DELETE_CHUNK_SIZE):
+                chunk = deleted[start:start + DELETE_CHUNK_SIZE]
+                ttk.Treeview.delete(tree, *chunk)
+                for iid in chunk:
+                    del shown[iid]
+                stats['deleted'] += len(chunk)
+                yield stats['deleted'], total
+
+            last = kept[-1] if kept else None
+            previous = None
+            appended = []   # inserções no fim, enviadas em lote por bulk_insert()
+            for done, (iid, row) in enumerate(new_values.items(), start=len(deleted) + 1):
+                old_row = shown.get(iid)
+                if iid not in stable and old_row is None and previous == last and previous is not None:
+                    appended.append((iid, row))
+                    last = previous = iid
+                    if len(appended) >= BULK_INSERT_CHUNK_SIZE:
+                        self._flush_appended(appended, shown, stats)
+                    yield done, total
+                    continue
+                self._flush_appended(appended, shown, stats)
+                if iid not in stable:
+                    if old_row is None:
+                        index = 0 if previous is None else ('end' if previous == last else
+                                                            ttk.Treeview.index(tree, previous) + 1)
+                        ttk.Treeview.insert(tree, "", index, iid=iid, values=row)
+                        stats['inserted'] += 1
+                    else:
+                        index = 0
+                        if previous is not None:
+                            index = ttk.Treeview.index(tree, previous)
+                            if ttk.Treeview.index(tree, iid) > index:
+                                index += 1
+                        ttk.Treeview.move(tree, iid, "", index)
+                        stats['moved'] += 1
+                        if iid == last:
+                            last = ttk.Treeview.get_children(tree)[-1]
+                    if previous == last:
+                        last = iid
+                if old_row is not None and old_row != row:
+                    ttk.Treeview.item(tree, iid, values=row)
+                    stats['updated'] += 1
+                shown[iid] = row
+                previous = iid
+                yield done, total
+            self._flush_appended(appended, shown, stats)
+            completed = True
+        finally:
+            if completed:
+                self._values = new_values
+            else:
+                try:
+                    self._values = {iid: shown[iid] for iid in ttk.Treeview.get_children(tree)}
+                except tk.TclError:
+                    self._values = {}
+
+        if anchor in new_values and ttk.Treeview.index(tree, anchor) != anchor_index:
+            # Um quarto de linha de folga evita que o arredondamento do Tk mostre a linha anterior.
+            ttk.Treeview.yview_moveto(tree, (ttk.Treeview.index(tree, anchor) + 0.25) / len(new_values))
+        return stats
+
+    def _flush_appended(self, appended: list, shown: dict, stats: dict):
+        if not appended:
+            return
+        bulk_insert(self.tree, appended)
+        shown.update(appended)
+        stats['inserted'] += len(appended)
+        appended.clear()
+
+    def clear(self):
+        """Remove todos os itens controlados pelo binder."""
+        self.bind_rows([])
+
+    @staticmethod
+    def _iter_stable_keys(kept: list, new_values: dict, stable: set, progress: tuple):
+        """
+        Preenche 'stable' com as chaves que podem ficar onde estão (a maior subsequência
+        crescente das posições antigas), produzindo 'progress' a cada PREPARE_CHUNK_SIZE passos.
+        """
+        old_position = {}
+        for index, iid in enumerate(kept):
+            old_position[iid] = index
+            if (index + 1) % PREPARE_CHUNK_SIZE == 0:
+                yield progress
+        tails, tail_ids, parent = [], [], {}
+        for count, iid in enumerate(new_values, start=1):
+            if count % PREPARE_CHUNK_SIZE == 0:
+                yield progress
+            position = old_position.get(iid)
+            if position is None:
+                continue
+            slot = bisect.bisect_left(tails, position)
+            parent[iid] = tail_ids[slot - 1] if slot else None
+            if slot == len(tails):
+                tails.append(position)
+                tail_ids.append(iid)
+            else:
+                tails[slot] = position
+                tail_ids[slot] = iid
+        iid = tail_ids[-1] if tail_ids else None
+        while iid is not None:
+            stable.add(iid)
+            iid = parent[iid]
+            if len(stable) % PREPARE_CHUNK_SIZE == 0:
+                yield progress
+
+    def _first_visible(self):
+        """iid da primeira linha visível, ou None se a Treeview estiver vazia ou oculta."""
+        if not self._values:
+            return None
+        height = self.tree.winfo_height()
+        for y in range(0, max(height, 1), 4):
+            iid = ttk.Treeview.identify_row(self.tree, y)
+            if iid:
+                return iid
+        return None
@@ -0,0 +1,391 @@
+import logging
+import threading
+from tkinter import ttk
+
+from .row_adapter import dataframe_to_rows
+from .tree_binder import TreeviewBinder
+
+class ListDataSource:
+    """Fonte de dados em memória para a VirtualTreeview (lista de tuplas já prontas para exibição)."""
+
+    def __init__(self, rows=None):
+        self.rows = list(rows or [])
+        self.has_more = False
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get_rows(self, start: int, stop: int):
+        return self.rows[start:stop]
+
+    def find_index(self, key, key_index: int):
+        for index, row in enumerate(self.rows):
+            if str(row[key_index]) == key:
+                return index
+        return None
+
+class KeysetPageSource(ListDataSource):
+    """
+    Fonte de dados paginada: busca páginas sob demanda conforme o usuário rola a lista.
+
+    'fetch_page' recebe (token, page_size) e devolve (DataFrame, próximo_token), no mesmo
+    contrato de GenericRepository.read_table_page. Apenas as linhas já buscadas ficam em
+    memória (como tuplas); nenhuma delas vira item do Tk até entrar na área visível.
+    Com auto_fetch=True get_rows() busca as páginas que faltam na própria chamada, isto é, na
+    thread do Tk. Nos painéis use auto_fetch=False: a rolagem não busca páginas e cabe ao
+    controller chamar fetch_more() no executor de banco (BasePanel.page_in_background ou um
+    botão "Carregar mais antigos"). fetch_more() é serializado por um lock, então duas
+    chamadas concorrentes nunca buscam a mesma página.
+    """
+
+    def __init__(self, fetch_page, page_size: int = 200, to_rows=None, auto_fetch: bool = True):
+        super().__init__()
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.auto_fetch = auto_fetch
+        self.to_rows = to_rows or dataframe_to_rows
+        self.has_more = True
+        self.error = None
+        self._token = None
+        self._lock = threading.Lock()
+
+    def fetch_more(self) -> int:
+        """Busca a próxima página e retorna a quantidade de linhas adicionadas."""
+        with self._lock:
+            if not self.has_more:
+                return 0
+            df, token = self.fetch_page(self._token, self.page_size)
+            new_rows = self.to_rows(df) if not df.empty else []
+            self.rows.extend(new_rows)
+            self._token = token
+            self.has_more = token is not None
+            return len(new_rows)
+
+    def ensure_loaded(self, stop: int):
+        """Garante que as linhas até o índice 'stop' estejam carregadas, se existirem."""
+        while self.auto_fetch and self.has_more and len(self.rows) < stop:
+            try:
+                self.fetch_more()
+            except Exception as e:
+                logging.error(f"Falha ao buscar a próxima página de dados: {e}")
+                self.error = e
+                self.has_more = False
+
+    def get_rows(self, start: int, stop: int):
+        self.ensure_loaded(stop)
+        return self.rows[start:stop]
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    Treeview virtualizada: mantém como itens reais do Tk apenas as linhas visíveis
+    (mais um pequeno buffer), buscando-as sob demanda na fonte de dados durante a rolagem.
+
+    Os iids são derivados da coluna 'key_index' (normalmente a PK), de modo que a seleção
+    sobrevive à rolagem e às recargas. selection(), item(), selection_remove() e o evento
+    <<TreeviewSelect>> mantêm o contrato da ttk.Treeview, então os controllers não mudam.
+    """
+
+    DEFAULT_ROW_HEIGHT = 20
+    DEFAULT_HEADER_HEIGHT = 25
+
+    def __init__(self, master=None, key_index: int = 0, buffer_rows: int = 5, **kw):
+        self._yscrollcommand = kw.pop('yscrollcommand', None)
+        super().__init__(master, **kw)
+        self.key_index = key_index
+        self.buffer_rows = buffer_rows
+        self._source = ListDataSource()
+        self._offset = 0
+        self._rendered = []
+        self._binder = TreeviewBinder(self, key_index, keep_view=False)
+        self._selected = {}
+        self._focus_key = None
+        self._select_callbacks = []
+        self._load_more = None
+        self._follow_end = False
+        self._reset_offscreen = False
+        self._row_height = None
+        self._header_height = None
+
+        super().bind("<<TreeviewSelect>>", self._on_native_select, add='+')
+        super().bind("<Configure>", lambda e: self._render(), add='+')
+        super().bind("<ButtonPress-1>", self._on_click, add='+')
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            super().bind(sequence, self._on_mousewheel)
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            super().bind(sequence, self._on_key_nav)
+        super().configure(yscrollcommand=self._on_native_scroll)
+
+    # ------------------------------------------------------------------ dados
+
+    def set_data_source(self, source):
+        """Substitui a fonte de dados, preservando a posição de rolagem e a seleção por chave."""
+        self._source = source
+        self._follow_end = False
+        self._render()
+
+    def set_rows(self, rows):
+        """Atalho para exibir uma lista de tuplas já carregada em memória."""
+        self.set_data_source(ListDataSource(rows))
+
+    def get_data_source(self):
+        return self._source
+
+    def refresh(self):
+        if self._follow_end:
+            # End pressionado com páginas pendentes: acompanha o fim até a fonte se esgotar.
+            self._follow_end = self._source.has_more
+            self._move_focus(len(self._source) - 1)
+        else:
+            self._render()
+
+    def set_load_more(self, callback):
+        """
+        Registra 'callback(fonte)', chamado quando a janela visível alcança o fim das linhas já
+        carregadas e a fonte ainda tem páginas (has_more). Com KeysetPageSource(auto_fetch=False)
+        o callback busca a próxima página fora da thread do Tk e chama refresh() ao recebê-la.
+        """
+        self._load_more = callback
+
+    def _key_of(self, row) -> str:
+        return str(row[self.key_index])
+
+    # ------------------------------------------------------------ renderização
+
+    def _row_metrics(self):
+        if self._row_height is None and self._rendered:
+            bbox = super().bbox(self._rendered[0])
+            if bbox:
+                self._header_height = bbox[1]
+                self._row_height = max(1, bbox[3])
+        return (self._row_height or self.DEFAULT_ROW_HEIGHT,
+                self._header_height if self._header_height is not None else self.DEFAULT_HEADER_HEIGHT)
+
+    def _visible_rows(self) -> int:
+        height = self.winfo_height()
+        if height <= 1:
+            return int(self.cget('height'))
+        row_height, header_height = self._row_metrics()
+        return max(1, (height - header_height) // row_height)
+
+    def _render(self):
+        visible = self._visible_rows()
+        window = visible + self.buffer_rows
+        rows = self._source.get_rows(self._offset, self._offset + window)
+        if len(rows) < visible and self._offset > 0:
+            self._offset = max(0, len(self._source) - visible)
+            rows = self._source.get_rows(self._offset, self._offset + window)
+
+        desired = [self._key_of(row) for row in rows]
+        # Rolar uma linha remove um item e insere outro; o restante da janela não é tocado.
+        self._binder.bind_rows(rows)
+        self._rendered = desired
+
+        for iid, row in zip(desired, rows):
+            if iid in self._selected:
+                self._selected[iid] = tuple(row)
+        super().selection_set([iid for iid in desired if iid in self._selected])
+        if self._focus_key in desired:
+            super().focus(self._focus_key)
+        super().yview_moveto(0)
+        self._update_scrollbar(visible)
+        if self._load_more and self._source.has_more and self._offset + window >= len(self._source):
+            self._load_more(self._source)
+
+    def _update_scrollbar(self, visible: int):
+        if not self._yscrollcommand:
+            return
+        total = len(self._source)
+        if total == 0:
+            self._yscrollcommand(0.0, 1.0)
+            return
+        first = self._offset / total
+        last = min(1.0, (self._offset + visible) / total)
+        self._yscrollcommand(first, last)
+
+    def _scroll_to(self, offset: int):
+        self._offset = max(0, offset)
+        self._render()
+
+    # ----------------------------------------------------------------- rolagem
+
+    def yview(self, *args):
+        """Interpreta os comandos da Scrollbar sobre o conjunto virtual de linhas."""
+        visible = self._visible_rows()
+        total = len(self._source)
+        if args:
+            self._follow_end = False
+        if not args:
+            if total == 0:
+                return 0.0, 1.0
+            return self._offset / total, min(1.0, (self._offset + visible) / total)
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * total))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (visible if args[2] == 'pages' else 1)
+            self._scroll_to(self._offset + step)
+
+    def yview_moveto(self, fraction):
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview('scroll', number, what)
+
+    def _on_native_scroll(self, first, last):
+        """Corrige rolagens internas do Tk (ex.: 'see' ao clicar na última linha parcial)."""
+        first = float(first)
+        if first > 0 and self._rendered:
+            self._scroll_to(self._offset + round(first * len(self._rendered)))
+
+    def _on_mousewheel(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.yview('scroll', -3, 'units')
+        else:
+            self.yview('scroll', 3, 'units')
+        return "break"
+
+    def see(self, item):
+        if item in self._rendered[:self._visible_rows()]:
+            return
+        index = self._source.find_index(item, self.key_index)
+        if index is not None:
+            self._scroll_to(index - self._visible_rows() // 2)
+
+    # ----------------------------------------------------------------- seleção
+
+    def bind(self, sequence=None, func=None, add=None):
+        if sequence == "<<TreeviewSelect>>" and func is not None:
+            if not add:
+                self._select_callbacks = []
+            self._select_callbacks.append(func)
+            return None
+        return super().bind(sequence, func, add)
+
+    def _dispatch_select(self, event=None):
+        for callback in list(self._select_callbacks):
+            callback(event)
+
+    def _on_click(self, event):
+        self._follow_end = False
+        self._reset_offscreen = not (event.state & 0x0001 or event.state & 0x0004)
+
+    def _on_native_select(self, event=None):
+        native = super().selection()
+        rendered = set(self._rendered)
+        if str(self.cget('selectmode')) == 'browse' or self._reset_offscreen:
+            new_keys = list(native) or [k for k in self._selected if k not in rendered]
+        else:
+            new_keys = [k for k in self._selected if k not in rendered] + list(native)
+        self._reset_offscreen = False
+
+        focus = super().focus()
+        if focus:
+            self._focus_key = focus
+        if new_keys == list(self._selected):
+            return
+        self._selected = {key: self._values_of(key) for key in new_keys}
+        self._dispatch_select(event)
+
+    def _values_of(self, key):
+        if key in self._rendered:
+            return tuple(super().item(key, 'values'))
+        return self._selected.get(key, ())
+
+    def selection(self):
+        return tuple(self._selected)
+
+    def selection_set(self, *items):
+        keys = self._flatten(items)
+        self._selected = {key: self._values_of(key) for key in keys}
+        super().selection_set([key for key in keys if key in self._rendered])
+
+    def selection_add(self, *items):
+        for key in self._flatten(items):
+            self._selected[key] = self._values_of(key)
+        super().selection_set([key for key in self._selected if key in self._rendered])
+
+    def selection_remove(self, *items):
+        for key in self._flatten(items):
+            self._selected.pop(key, None)
+        super().selection_set([key for key in self._selected if key in self._rendered])
+
+    @staticmethod
+    def _flatten(items):
+        keys = []
+        for item in items:
+            if isinstance(item, (list, tuple)):
+                keys.extend(str(i) for i in item)
+            else:
+                keys.append(str(item))
+        return keys
+
+    def item(self, item, option=None, **kw):
+        if item in self._rendered or kw:
+            return super().item(item, option, **kw)
+        values = self._selected.get(item, ())
+        if option == 'values':
+            return values
+        if option is not None:
+            return ''
+        return {'text': '', 'image': '', 'values': values, 'open': 0, 'tags': ''}
+
+    # ----------------------------------------------------------------- teclado
+
+    def _on_key_nav(self, event):
+        """
+        Setas, PageUp/PageDown e Home/End movem o foco e a seleção pelo conjunto virtual.
+        End vai à última linha carregada; se a fonte ainda tiver páginas, a Treeview acompanha
+        o fim a cada página buscada em segundo plano (set_load_more) até a fonte se esgotar.
+        """
+        total = len(self._source)
+        if total == 0:
+            return "break"
+        visible = self._visible_rows()
+        current = self._offset
+        if self._focus_key in self._rendered:
+            current = self._offset + self._rendered.index(self._focus_key)
+
+        steps = {'Up': -1, 'Down': 1, 'Prior': -visible, 'Next': visible}
+        self._follow_end = event.keysym == 'End' and self._source.has_more
+        if event.keysym == 'Home':
+            target = 0
+        elif event.keysym == 'End':
+            target = total - 1
+        else:
+            target = current + steps[event.keysym]
+            self._source.get_rows(target, target + 1)
+        self._move_focus(target)
+        return "break"
+
+    def _move_focus(self, target: int):
+        """Rola o mínimo necessário para exibir a linha 'target' e a torna o foco e a seleção."""
+        visible = self._visible_rows()
+        target = max(0, min(target, len(self._source) - 1))
+        if target < self._offset:
+            self._offset = target
+        elif target >= self._offset + visible:
+            self._offset = target - visible + 1
+        row = self._source.get_rows(target, target + 1)[0]
+        key = self._key_of(row)
+        self._focus_key = key
+        self._selected = {key: tuple(row)}
+        self._render()
+        self._dispatch_select()
+
+    # ----------------------------------------------------------- configuração
+
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, dict) and 'yscrollcommand' in cnf:
+            cnf = dict(cnf)
+            self._yscrollcommand = cnf.pop('yscrollcommand')
+        if 'yscrollcommand' in kw:
+            self._yscrollcommand = kw.pop('yscrollcommand')
+            self._render()
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def __setitem__(self, key, value):
+        if key == 'yscrollcommand':
+            self.configure(yscrollcommand=value)
+        else:
+            super().__setitem__(key, value)
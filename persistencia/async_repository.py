@@ -0,0 +1,188 @@
+import asyncio
+import logging
+
+import pandas as pd
+from sqlalchemy import text, exc, event
+from sqlalchemy.sql.elements import TextClause
+
+import config
+from .database import DatabaseManager, SQLITE_PROFILES, _sqlite_pragma_listener
+from .pool_settings import pool_engine_options
+from .query_cache import QueryCache
+from .repository import BULK_INSERT_CHUNK_SIZE, MAX_BIND_PARAMS, _build_statement, _column_to_python
+
+class AsyncGenericRepository:
+    """
+    Variante asyncio do GenericRepository para rotinas sem interface (importações/exportações em lote).
+
+    Usa a engine assíncrona do SQLAlchemy com a URL montada a partir do mesmo banco.ini do
+    DatabaseManager (sqlite+aiosqlite, postgresql+asyncpg, mysql+aiomysql, ...). O número de
+    operações simultâneas é limitado por ASYNC_DB_MAX_CONCURRENCY, de modo que vários jobs
+    possam sobrepor I/O sem esgotar o pool de conexões. O driver do SQLite (aiosqlite) consta
+    do requirements.txt; para os demais bancos instale o driver assíncrono correspondente.
+    """
+    _engine = None
+    _semaphore = None
+    _semaphore_loop = None
+
+    @classmethod
+    def get_engine(cls):
+        """Retorna a AsyncEngine (criada na primeira chamada)."""
+        if not config.DATABASE_ENABLED:
+            logging.warning("Acesso ao banco de dados está desativado em config.py. Nenhuma engine será criada.")
+            return None
+        if cls._engine is None:
+            cls._engine = cls._create_engine()
+        return cls._engine
+
+    @classmethod
+    def _create_engine(cls):
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from .security import load_key
+
+        db_config = DatabaseManager._parse_active_config()
+        pool_config = DatabaseManager._parse_pool_config()
+        db_type = db_config.get('type', 'sqlite').lower()
+        key = load_key() if db_type != 'sqlite' else None
+        connection_url = DatabaseManager.build_connection_url(db_config, key, use_async=True)
+
+        engine_options = {'echo': False, **pool_engine_options(pool_config, use_async=True)}
+        if db_type == 'sqlite':
+            sqlite_profile = DatabaseManager._parse_sqlite_profile()
+            engine_options['connect_args'] = {'timeout': SQLITE_PROFILES[sqlite_profile]['busy_timeout'] / 1000}
+        try:
+            engine = create_async_engine(connection_url, **engine_options)
+        except ImportError as e:
+            raise ImportError(f"Driver assíncrono para '{db_type}' não instalado ({e}). "
+                              f"Para SQLite instale com: pip install aiosqlite") from e
+        if db_type == 'sqlite':
+            event.listen(engine.sync_engine, "connect", _sqlite_pragma_listener(sqlite_profile))
+        logging.info(f"Engine assíncrona criada para '{db_type}' "
+                     f"(concorrência máxima: {config.ASYNC_DB_MAX_CONCURRENCY}).")
+        return engine
+
+    @classmethod
+    async def dispose(cls):
+        """Fecha as conexões da engine assíncrona; chame ao final do job."""
+        if cls._engine is not None:
+            engine, cls._engine = cls._engine, None
+            await engine.dispose()
+
+    @classmethod
+    def _limiter(cls) -> asyncio.Semaphore:
+        # O semáforo pertence ao loop em execução; cada asyncio.run() de um job recebe o seu.
+        loop = asyncio.get_running_loop()
+        if cls._semaphore is None or cls._semaphore_loop is not loop:
+            cls._semaphore = asyncio.Semaphore(config.ASYNC_DB_MAX_CONCURRENCY)
+            cls._semaphore_loop = loop
+        return cls._semaphore
+
+    @staticmethod
+    async def execute_query_to_dataframe(query, params: dict = None):
+        """Executa uma query e retorna um DataFrame com colunas minúsculas."""
+        engine = AsyncGenericRepository.get_engine()
+        if not engine:
+            return pd.DataFrame()
+
+        statement = query if isinstance(query, TextClause) else text(query)
+        try:
+            async with AsyncGenericRepository._limiter(), engine.connect() as connection:
+                df = await connection.run_sync(
+                    lambda sync_connection: pd.read_sql_query(statement, sync_connection, params=params))
+            df.columns = [str(col).lower() for col in df.columns]
+            return df
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao executar a query assíncrona: {query}\nErro: {e}")
+            raise
+
+    @staticmethod
+    async def read_table_to_dataframe(table_name: str, columns: list = None, where_conditions: dict = None):
+        """Lê uma tabela (espera nomes minúsculos), opcionalmente filtrando por igualdade."""
+        where_conditions = {k.lower(): v for k, v in (where_conditions or {}).items()}
+        statement = _build_statement('select', table_name, tuple(col.lower() for col in columns or ()),
+                                     tuple(where_conditions))
+        return await AsyncGenericRepository.execute_query_to_dataframe(statement, params=where_conditions)
+
+    @staticmethod
+    async def write_dataframe_to_table(df: pd.DataFrame, table_name: str, chunksize: int = None,
+                                       method: str = None):
+        """
+        Escreve um DataFrame em uma tabela em uma única transação, com o mesmo contrato de
+        GenericRepository.write_dataframe_to_table. Retorna a quantidade de registros inseridos.
+        """
+        engine = AsyncGenericRepository.get_engine()
+        if not engine:
+            return 0
+        if method not in (None, 'multi'):
+            raise ValueError(f"Método de inserção inválido: '{method}'. Use None ou 'multi'.")
+        if df.empty:
+            return 0
+
+        columns = tuple(str(col).lower() for col in df.columns)
+        records = list(zip(*[_column_to_python(df.iloc[:, i]) for i in range(len(columns))]))
+        chunksize = chunksize or BULK_INSERT_CHUNK_SIZE
+
+        try:
+            async with AsyncGenericRepository._limiter(), engine.begin() as connection:
+                if method == 'multi':
+                    rows_per_statement = max(1, min(chunksize, MAX_BIND_PARAMS // len(columns)))
+                    for start in range(0, len(records), rows_per_statement):
+                        chunk = records[start:start + rows_per_statement]
+                        params = {f"{col}_{i}": value
+                                  for i, record in enumerate(chunk) for col, value in zip(columns, record)}
+                        await connection.execute(_build_statement('insert', table_name, columns, rows=len(chunk)),
+                                                 params)
+                else:
+                    statement = _build_statement('insert', table_name, columns)
+                    for start in range(0, len(records), chunksize):
+                        chunk = records[start:start + chunksize]
+                        await connection.execute(statement, [dict(zip(columns, record)) for record in chunk])
+            QueryCache.invalidate(table_name)
+            logging.info(f"{len(records)} registros inseridos (async) na tabela '{table_name}'.")
+            return len(records)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao escrever (async) na tabela '{table_name}'. Colunas do DF: {list(df.columns)}. "
+                          f"Erro: {e}")
+            raise
+
+    @staticmethod
+    async def update_table(table_name: str, update_values: dict, where_conditions: dict):
+        """Atualiza registros em uma tabela e retorna a quantidade de linhas afetadas."""
+        engine = AsyncGenericRepository.get_engine()
+        if not engine:
+            return 0
+
+        set_columns = tuple(k.lower() for k in update_values)
+        where_columns = tuple(k.lower() for k in where_conditions)
+        params = {f'{k}_val': v for k, v in zip(set_columns, update_values.values())}
+        params.update({f'wh_{k}': v for k, v in zip(where_columns, where_conditions.values())})
+
+        try:
+            async with AsyncGenericRepository._limiter(), engine.begin() as connection:
+                result = await connection.execute(
+                    _build_statement('update', table_name, set_columns, where_columns), params)
+            QueryCache.invalidate(table_name)
+            logging.info(f"Tabela '{table_name}' atualizada (async) com sucesso.")
+            return result.rowcount
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao atualizar (async) a tabela '{table_name}': {e}")
+            raise
+
+    @staticmethod
+    async def delete_from_table(table_name: str, where_conditions: dict):
+        """Deleta registros de uma tabela e retorna a quantidade de linhas removidas."""
+        engine = AsyncGenericRepository.get_engine()
+        if not engine:
+            return 0
+
+        params = {k.lower(): v for k, v in where_conditions.items()}
+        try:
+            async with AsyncGenericRepository._limiter(), engine.begin() as connection:
+                result = await connection.execute(
+                    _build_statement('delete', table_name, where_columns=tuple(params)), params)
+            QueryCache.invalidate(table_name)
+            logging.info(f"Registros da tabela '{table_name}' deletados (async) com sucesso.")
+            return result.rowcount
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao deletar (async) da tabela '{table_name}': {e}")
+            raise
@@ -0,0 +1,214 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import text
+
+import config
+from .database import DatabaseManager
+from .query_cache import QueryCache
+
+JOURNAL_PATH = Path(__file__).parent.parent / "logs" / "auditoria_pendente.jsonl"
+
+_INSERT_LOG = text("INSERT INTO log_alteracoes (timestamp, login_usuario, acao) VALUES (:ts, :login, :acao)")
+_STOP = object()
+
+class AuditWriter:
+    """
+    Gravação da trilha de auditoria (log_alteracoes), com dois modos definidos por
+    audit_mode no config_settings.ini:
+
+    * 'strict': o registro é inserido na mesma transação da alteração auditada; se um falhar,
+      nenhum dos dois é gravado.
+    * 'queued': o registro entra em uma fila limitada e uma thread em segundo plano grava os
+      pendentes em lotes (um INSERT com vários registros por transação). A fila é esvaziada ao
+      encerrar a aplicação; lotes que não puderem ser gravados (banco indisponível, fila cheia)
+      vão para um diário local (logs/auditoria_pendente.jsonl), reenviado automaticamente
+      assim que o banco voltar. Registros ainda na memória se perdem apenas em uma queda
+      abrupta do processo, numa janela de até audit_flush_interval_ms.
+
+    As transações do DataService continuam sempre gravando o log dentro da própria transação.
+    """
+    _queue = None
+    _thread = None
+    _lock = threading.Lock()
+    _journal_lock = threading.Lock()
+
+    @staticmethod
+    def is_strict() -> bool:
+        return config.AUDIT_MODE == 'strict'
+
+    @staticmethod
+    def _entry(login_usuario: str, acao: str, timestamp: datetime = None) -> dict:
+        return {'ts': timestamp or datetime.now(), 'login': login_usuario, 'acao': acao}
+
+    @staticmethod
+    def write(connection, login_usuario: str, acao: str):
+        """Insere o registro usando a conexão (e a transação) de quem chama."""
+        connection.execute(_INSERT_LOG, AuditWriter._entry(login_usuario, acao))
+
+    @staticmethod
+    def write_many(connection, login_usuario: str, acoes: list):
+        """Insere vários registros (mesmo usuário e horário) em um único executemany na transação de quem chama."""
+        timestamp = datetime.now()
+        connection.execute(_INSERT_LOG, [AuditWriter._entry(login_usuario, acao, timestamp) for acao in acoes])
+
+    @classmethod
+    def record(cls, login_usuario: str, acao: str, connection=None):
+        """
+        Registra uma ação conforme o modo configurado. No modo 'strict', 'connection' deve
+        ser a conexão da transação auditada (sem ela o registro é gravado em transação
+        própria). No modo 'queued' o registro é enfileirado; chame após o commit.
+        """
+        if not config.DATABASE_ENABLED:
+            return
+        if cls.is_strict():
+            if connection is not None:
+                cls.write(connection, login_usuario, acao)
+                return
+            engine = DatabaseManager.get_engine()
+            with engine.begin() as own_connection:
+                cls.write(own_connection, login_usuario, acao)
+            QueryCache.invalidate('log_alteracoes')
+        else:
+            cls.enqueue(login_usuario, acao)
+
+    @classmethod
+    def enqueue(cls, login_usuario: str, acao: str):
+        """Enfileira um registro para gravação em lote; com a fila cheia, grava no diário local."""
+        entry = cls._entry(login_usuario, acao)
+        try:
+            cls._get_queue().put_nowait(entry)
+        except queue.Full:
+            logging.warning("Fila de auditoria cheia; registro gravado no diário local.")
+            cls._append_journal([entry])
+
+    @classmethod
+    def _get_queue(cls) -> queue.Queue:
+        if cls._thread is None:
+            with cls._lock:
+                if cls._thread is None:
+                    cls._queue = queue.Queue(maxsize=config.AUDIT_QUEUE_MAX_SIZE)
+                    cls._thread = threading.Thread(target=cls._run, name="audit-writer", daemon=True)
+                    cls._thread.start()
+                    logging.info(f"Gravador de auditoria iniciado (lotes de até {config.AUDIT_BATCH_SIZE}, "
+                                 f"intervalo de {config.AUDIT_FLUSH_INTERVAL_MS} ms).")
+        return cls._queue
+
+    @classmethod
+    def _run(cls):
+        audit_queue = cls._queue
+        cls.replay_journal()
+        stopping = False
+        while not stopping:
+            item = audit_queue.get()
+            batch = []
+            if item is _STOP:
+                stopping = True
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + config.AUDIT_FLUSH_INTERVAL_MS / 1000
+                while len(batch) < config.AUDIT_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = audit_queue.get(timeout=remaining) if remaining > 0 else audit_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            if batch and cls._write_batch(batch) and JOURNAL_PATH.is_file():
+                cls.replay_journal()
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                audit_queue.task_done()
+
+    @classmethod
+    def _write_batch(cls, batch: list) -> bool:
+        try:
+            engine = DatabaseManager.get_engine()
+            with engine.begin() as connection:
+                connection.execute(_INSERT_LOG, batch)
+            QueryCache.invalidate('log_alteracoes')
+            logging.debug(f"{len(batch)} registro(s) de auditoria gravados em lote.")
+            return True
+        except Exception as e:
+            logging.error(f"Falha ao gravar {len(batch)} registro(s) de auditoria; enviados ao diário local. Erro: {e}")
+            cls._append_journal(batch)
+            return False
+
+    @classmethod
+    def _append_journal(cls, entries: list):
+        with cls._journal_lock:
+            JOURNAL_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(JOURNAL_PATH, 'a', encoding='utf-8') as journal:
+                for entry in entries:
+                    journal.write(json.dumps({'ts': entry['ts'].isoformat(), 'login': entry['login'],
+                                              'acao': entry['acao']}, ensure_ascii=False) + "\n")
+                journal.flush()
+
+    @classmethod
+    def replay_journal(cls) -> int:
+        """Grava no banco os registros do diário local e o apaga. Retorna a quantidade reenviada."""
+        with cls._journal_lock:
+            if not JOURNAL_PATH.is_file():
+                return 0
+            entries = []
+            with open(JOURNAL_PATH, encoding='utf-8') as journal:
+                for line in journal:
+                    if line.strip():
+                        record = json.loads(line)
+                        entries.append(cls._entry(record['login'], record['acao'],
+                                                  datetime.fromisoformat(record['ts'])))
+            if entries:
+                try:
+                    engine = DatabaseManager.get_engine()
+                    with engine.begin() as connection:
+                        connection.execute(_INSERT_LOG, entries)
+                except Exception as e:
+                    logging.warning(f"Diário de auditoria mantido ({len(entries)} registro(s)); banco indisponível: {e}")
+                    return 0
+                QueryCache.invalidate('log_alteracoes')
+                logging.info(f"{len(entries)} registro(s) do diário de auditoria gravados no banco.")
+            JOURNAL_PATH.unlink()
+        return len(entries)
+
+    @classmethod
+    def flush(cls):
+        """Bloqueia até que todos os registros enfileirados tenham sido processados."""
+        if cls._thread is not None and cls._thread.is_alive():
+            cls._queue.join()
+
+    @classmethod
+    def shutdown(cls, timeout: float = 10.0):
+        """Grava os registros pendentes e encerra a thread; o que sobrar vai para o diário local."""
+        with cls._lock:
+            thread, audit_queue = cls._thread, cls._queue
+            cls._thread = cls._queue = None
+        if thread is None:
+            return
+        try:
+            audit_queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(timeout)
+        leftovers = []
+        while True:
+            try:
+                item = audit_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftovers.append(item)
+        if leftovers:
+            logging.warning(f"{len(leftovers)} registro(s) de auditoria não gravados a tempo; enviados ao diário local.")
+            cls._append_journal(leftovers)
+        logging.info("Gravador de auditoria encerrado.")
+
+# Rotinas sem interface também esvaziam a fila ao terminar o processo.
+atexit.register(AuditWriter.shutdown)
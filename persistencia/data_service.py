@@ -1,6 +1,8 @@
-from datetime import datetime
-from sqlalchemy import text, exc
-from .repository import GenericRepository
+from sqlalchemy import text, exc, bindparam
+from .repository import GenericRepository, MAX_BIND_PARAMS
+from .query_cache import QueryCache
+from .audit_writer import AuditWriter
+from .reference_cache import ReferenceCache
 import logging
 
 class DataService:
@@ -8,6 +10,25 @@ class DataService:
     Classe de serviço para executar operações de negócio complexas e transações atômicas.
     Garante a integridade dos dados em operações que envolvem múltiplas tabelas.
     """
+    RECLASSIFICADO = "reclassificado"
+    JA_PERTENCE = "já pertence ao tipo"
+    NAO_ENCONTRADO = "não encontrado"
+
+    @staticmethod
+    def _resolver_tipo(novo_tipo_nome: str):
+        """
+        Resolve o id do tipo pelo ReferenceCache antes de abrir a transação: com o índice
+        frio a leitura usa uma conexão própria, que não pode disputar o pool com a conexão
+        da transação. Retorna (id, None) ou (None, mensagem de erro).
+        """
+        try:
+            id_novo_tipo = ReferenceCache.id_for('tipos_vegetais', novo_tipo_nome)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Falha ao consultar os tipos de vegetais: {e}")
+            return None, f"Ocorreu um erro no banco de dados: {e}"
+        if id_novo_tipo is None:
+            return None, f"Tipo '{novo_tipo_nome}' não encontrado."
+        return id_novo_tipo, None
 
     @staticmethod
     def reclassificar_vegetal_e_logar(nome_vegetal: str, novo_tipo_nome: str, usuario: str):
@@ -15,6 +36,10 @@ class DataService:
         Reclassifica um vegetal para um novo tipo e registra a ação na trilha de auditoria.
         Esta operação é atômica.
         """
+        id_novo_tipo, erro = DataService._resolver_tipo(novo_tipo_nome)
+        if erro:
+            return False, erro
+
         engine = GenericRepository.get_engine()
         with engine.connect() as connection:
             with connection.begin() as transaction:
@@ -28,14 +53,6 @@ class DataService:
                         return False, f"Vegetal '{nome_vegetal}' não encontrado."   
                     id_vegetal, id_tipo_antigo = res_vegetal
 
-                    res_novo_tipo = connection.execute(
-                        text("SELECT id FROM tipos_vegetais WHERE nome = :nome"),
-                        {'nome': novo_tipo_nome}
-                    ).first()   
-                    if not res_novo_tipo:
-                        return False, f"Tipo '{novo_tipo_nome}' não encontrado."   
-                    id_novo_tipo = res_novo_tipo[0]
-
                     if id_tipo_antigo == id_novo_tipo:
                         return False, "O vegetal já pertence a este tipo."
 
@@ -47,15 +64,10 @@ class DataService:
                     acao_log = (f"O vegetal '{nome_vegetal}' (ID: {id_vegetal}) foi reclassificado "
                                 f"para o tipo '{novo_tipo_nome}' (ID: {id_novo_tipo}).")
 
-                    connection.execute(
-                        text("""
-                             INSERT INTO log_alteracoes (timestamp, login_usuario, acao)
-                             VALUES (:ts, :login, :acao)
-                             """),
-                        {'ts': datetime.now(), 'login': usuario, 'acao': acao_log}
-                    )   
+                    AuditWriter.write(connection, usuario, acao_log)
 
                     transaction.commit()
+                    QueryCache.invalidate('vegetais', 'log_alteracoes')
                     logging.info(f"Transação de reclassificação do vegetal '{nome_vegetal}' concluída com sucesso.")
                     return True, "Vegetal reclassificado e ação auditada com sucesso!"
 
@@ -91,15 +103,87 @@ class DataService:
 
                     acao_log = f"Espécie '{nome_antigo}' foi renomeada para '{nome_novo}'."   
                                                                                     
-                    log_stmt = text(
-                        "INSERT INTO log_alteracoes (timestamp, login_usuario, acao) VALUES (:ts, :login, :acao)")   
-                    connection.execute(log_stmt, {'ts': datetime.now(), 'login': usuario, 'acao': acao_log})
+                    AuditWriter.write(connection, usuario, acao_log)
 
                     transaction.commit()
+                    QueryCache.invalidate('especie_gatos', 'log_alteracoes')
                     logging.info(f"Transação de renomeação da espécie '{nome_antigo}' concluída com sucesso.")
                     return True, "Espécie renomeada e ação registrada no log com sucesso."   
 
                 except exc.SQLAlchemyError as e:   
                     transaction.rollback()
                     logging.error(f"Falha na transação de renomeação: {e}")
-                    return False, f"Ocorreu um erro no banco de dados: {e}"   
\ No newline at end of file
+                    return False, f"Ocorreu um erro no banco de dados: {e}"   
+
+    @staticmethod
+    def reclassificar_vegetais_e_logar(ids_vegetais: list, novo_tipo_nome: str, usuario: str):
+        """
+        Reclassifica vários vegetais (por id) para um novo tipo em uma única transação atômica:
+        o tipo é resolvido pelo ReferenceCache,
+        um SELECT e um UPDATE ... WHERE id IN (...) por lote de até MAX_BIND_PARAMS parâmetros e uma única
+        inserção em lote na trilha de auditoria (um registro por vegetal alterado).
+
+        Retorna (sucesso, mensagem, resultados), onde 'resultados' mapeia cada id para
+        RECLASSIFICADO, JA_PERTENCE ou NAO_ENCONTRADO. Em caso de falha nada é gravado.
+        """
+        ids_vegetais = list(dict.fromkeys(int(id_vegetal) for id_vegetal in ids_vegetais))
+        if not ids_vegetais:
+            return False, "Nenhum vegetal selecionado.", {}
+
+        select_vegetais = text("""
+                               SELECT v.id, v.nome, v.id_tipo, tv.nome AS tipo
+                               FROM vegetais v
+                                        LEFT JOIN tipos_vegetais tv ON v.id_tipo = tv.id
+                               WHERE v.id IN :ids
+                               """).bindparams(bindparam('ids', expanding=True))
+        update_vegetais = text("UPDATE vegetais SET id_tipo = :id_tipo WHERE id IN :ids").bindparams(
+            bindparam('ids', expanding=True))
+
+        id_novo_tipo, erro = DataService._resolver_tipo(novo_tipo_nome)
+        if erro:
+            return False, erro, {}
+
+        engine = GenericRepository.get_engine()
+        with engine.connect() as connection:
+            with connection.begin() as transaction:
+                try:
+                    encontrados = {}
+                    for start in range(0, len(ids_vegetais), MAX_BIND_PARAMS):
+                        chunk = ids_vegetais[start:start + MAX_BIND_PARAMS]
+                        for id_vegetal, nome, id_tipo, tipo in connection.execute(select_vegetais, {'ids': chunk}):
+                            encontrados[id_vegetal] = (nome, id_tipo, tipo)
+
+                    resultados, alterar, acoes = {}, [], []
+                    for id_vegetal in ids_vegetais:
+                        if id_vegetal not in encontrados:
+                            resultados[id_vegetal] = DataService.NAO_ENCONTRADO
+                            continue
+                        nome, id_tipo, tipo = encontrados[id_vegetal]
+                        if id_tipo == id_novo_tipo:
+                            resultados[id_vegetal] = DataService.JA_PERTENCE
+                            continue
+                        resultados[id_vegetal] = DataService.RECLASSIFICADO
+                        alterar.append(id_vegetal)
+                        acoes.append(f"O vegetal '{nome}' (ID: {id_vegetal}) foi reclassificado de '{tipo or '-'}' "
+                                     f"para o tipo '{novo_tipo_nome}' (ID: {id_novo_tipo}) em lote.")
+
+                    if not alterar:
+                        return False, "Nenhum vegetal precisou ser reclassificado.", resultados
+
+                    # :id_tipo ocupa um dos parâmetros, então o lote do UPDATE tem um id a menos.
+                    update_chunk = MAX_BIND_PARAMS - 1
+                    for start in range(0, len(alterar), update_chunk):
+                        connection.execute(update_vegetais, {'id_tipo': id_novo_tipo,
+                                                             'ids': alterar[start:start + update_chunk]})
+                    AuditWriter.write_many(connection, usuario, acoes)
+
+                    transaction.commit()
+                    QueryCache.invalidate('vegetais', 'log_alteracoes')
+                    logging.info(f"Reclassificação em lote para '{novo_tipo_nome}' concluída: {len(alterar)} de "
+                                 f"{len(ids_vegetais)} vegetais alterados.")
+                    return True, f"{len(alterar)} vegetal(is) reclassificado(s) e auditado(s) com sucesso!", resultados
+
+                except exc.SQLAlchemyError as e:
+                    transaction.rollback()
+                    logging.error(f"Falha na transação de reclassificação em lote: {e}")
+                    return False, f"Ocorreu um erro no banco de dados: {e}", {}
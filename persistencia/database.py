@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 from pathlib import Path
 from sqlalchemy import create_engine, text, event
 from sqlalchemy.engine import Engine
@@ -6,109 +8,271 @@ from sqlalchemy.exc import SQLAlchemyError, OperationalError
 
 import config
 from .security import load_key, decrypt_message
+from .pool_settings import validate_pool_settings, pool_engine_options
+from .sql_script import split_statements
 
 project_root = Path(__file__).parent.parent.resolve()
 CONFIG_PATH = project_root / "banco.ini"
 SCHEMA_PATH = project_root / "persistencia/sql_schema_SQLLite.sql"
 
-def _set_sqlite_pragma(dbapi_connection, connection_record):
-    """Executa o PRAGMA para ativar o suporte a chaves estrangeiras no SQLite."""
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+# Perfis de desempenho do SQLite, selecionados em [sqlite] profile = ... no banco.ini.
+# WAL exige que todos os processos que abrem o arquivo estejam na mesma máquina (usa memória
+# compartilhada); em pastas de rede acessadas por várias estações prefira o perfil 'safe'.
+SQLITE_PROFILES = {
+    'safe': {
+        'busy_timeout': 15000,
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+        'mmap_size': 0,
+    },
+    'balanced': {
+        'busy_timeout': 15000,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,
+        'temp_store': 'MEMORY',
+        'mmap_size': 0,
+    },
+    'fast-local': {
+        'busy_timeout': 15000,
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456,
+    },
+}
+DEFAULT_SQLITE_PROFILE = 'safe'
+
+def _sqlite_pragma_listener(profile: str):
+    """Cria o listener de 'connect' que aplica os PRAGMAs do perfil em cada nova conexão SQLite."""
+    pragmas = SQLITE_PROFILES[profile]
+
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        """Ativa o suporte a chaves estrangeiras e aplica os PRAGMAs de desempenho do perfil."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return _set_sqlite_pragma
+
+def _log_sqlite_pragmas(connection, profile: str):
+    """Registra no log os valores efetivos dos PRAGMAs (o SQLite pode recusar alguns, ex.: WAL)."""
+    names = ['foreign_keys', *SQLITE_PROFILES[profile]]
+    effective = {name: connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names}
+    logging.info(f"Perfil SQLite '{profile}' ativo: " + ", ".join(f"{k}={v}" for k, v in effective.items()))
+
+# Drivers por tipo de banco do banco.ini: síncronos (GUI) e assíncronos (persistencia.async_repository).
+SYNC_DRIVERS = {
+    'sqlite': 'sqlite',
+    'postgresql': 'postgresql+psycopg2',
+    'mysql': 'mysql+pymysql',
+    'sqlserver': 'mssql+pymssql',
+    'mariadb': 'mariadb+mariadbconnector',
+    'oracle': 'oracle+oracledb',
+    'firebird': 'firebird+fdb',
+}
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+    'mariadb': 'mysql+aiomysql',
+    'sqlserver': 'mssql+aioodbc',
+    'oracle': 'oracle+oracledb_async',
+}
 
 class DatabaseManager:
     _engine = None
+    _lock = threading.Lock()
 
     @classmethod
-    def _parse_active_config(cls):
+    def _read_config_sections(cls):
+        """Lê o banco.ini e separa as chaves ativas por seção (linhas antes de qualquer seção vão para [database])."""
         if not CONFIG_PATH.is_file():
             raise FileNotFoundError(f"Arquivo de configuração '{CONFIG_PATH}' não encontrado.")
         with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
             lines = f.readlines()
-        active_config = {}
+        sections = {'database': {}}
+        current = sections['database']
         for line in lines:
             clean_line = line.strip()
-            if not clean_line or (clean_line.startswith('#') or clean_line.startswith(';')) or clean_line.startswith(
-                    '['):
+            if not clean_line or (clean_line.startswith('#') or clean_line.startswith(';')):
+                continue
+            if clean_line.startswith('['):
+                section_name = clean_line.split(']', 1)[0].strip('[ ').lower()
+                current = sections.setdefault(section_name, {})
                 continue
             if '=' in clean_line:
                 key, value = clean_line.split('=', 1)
-                active_config[key.strip()] = value.strip()
+                current[key.strip()] = value.strip()
+        return sections
+
+    @classmethod
+    def _parse_active_config(cls):
+        active_config = cls._read_config_sections()['database']
         if not active_config or 'type' not in active_config:
             raise ValueError(
                 "Nenhuma configuração de banco de dados ativa (descomentada) foi encontrada no 'banco.ini'.")
         return active_config
 
+    @classmethod
+    def _parse_pool_config(cls):
+        """Retorna as configurações validadas da seção [pool] (padrões do SQLAlchemy se ausente)."""
+        return validate_pool_settings(cls._read_config_sections().get('pool', {}))
+
+    @classmethod
+    def _parse_sqlite_profile(cls):
+        """Retorna o perfil de desempenho do SQLite definido em [sqlite] (padrão: 'safe')."""
+        profile = cls._read_config_sections().get('sqlite', {}).get('profile', DEFAULT_SQLITE_PROFILE).lower()
+        if profile not in SQLITE_PROFILES:
+            raise ValueError(f"Perfil SQLite inválido no banco.ini: '{profile}'. Use {', '.join(SQLITE_PROFILES)}.")
+        return profile
+
+    @classmethod
+    def build_connection_url(cls, db_config: dict, key, use_async: bool = False) -> str:
+        """Monta a URL de conexão a partir da configuração ativa do banco.ini (driver síncrono ou assíncrono)."""
+        db_type = db_config.get('type', 'sqlite').lower()
+        drivers = ASYNC_DRIVERS if use_async else SYNC_DRIVERS
+        if db_type not in drivers:
+            modo = " no modo assíncrono" if use_async and db_type in SYNC_DRIVERS else ""
+            raise ValueError(f"Tipo de banco de dados não suportado{modo}: '{db_type}'")
+        driver = drivers[db_type]
+
+        if db_type == 'sqlite':
+            db_path = project_root / db_config.get('path', 'sistema.db')
+            return f"{driver}:///{db_path}"
+
+        user = decrypt_message(db_config['user'], key)
+        password = decrypt_message(db_config['password'], key)
+        host = db_config['host']
+        dbname = db_config['dbname']
+        port = db_config.get('port')
+
+        url = f"{driver}://{user}:{password}@{host}:{port}/{dbname}"
+        if driver == 'mssql+aioodbc':
+            odbc_driver = db_config.get('odbc_driver', 'ODBC Driver 18 for SQL Server').replace(' ', '+')
+            url += f"?driver={odbc_driver}"
+        return url
+
     @classmethod
     def get_engine(cls):
         if not config.DATABASE_ENABLED:
             logging.warning("Acesso ao banco de dados está desativado em config.py. Nenhuma engine será criada.")
             return None
         if cls._engine is None:
-            try:
-                db_config = cls._parse_active_config()
-                key = load_key()
-            except (FileNotFoundError, ValueError, RuntimeError) as e:
-                logging.critical(f"Erro ao ler configuração do banco: {e}")
-                raise
-            except Exception as e:
-                logging.critical(f"Falha CRÍTICA ao carregar a chave de segurança: {e}")
-                raise RuntimeError("Não foi possível carregar a chave 'secret.key'.") from e
-
-            db_type = db_config.get('type', 'sqlite').lower()
-            connection_url = None
-            engine_options = {'echo': False}
-            logging.info(f"Configuração ativa detectada: '{db_type}'")
-            try:
-                if db_type == 'sqlite':
-                    db_path = project_root / db_config.get('path', 'sistema.db')
-                    connection_url = f"sqlite:///{db_path}"
-                    engine_options['connect_args'] = {'timeout': 15}
-
-                    engine = create_engine(connection_url, **engine_options)
-
-                    event.listen(engine, "connect", _set_sqlite_pragma)
-                    cls._engine = engine
-                else:
-                    user = decrypt_message(db_config['user'], key)
-                    password = decrypt_message(db_config['password'], key)
-                    host = db_config['host']
-                    dbname = db_config['dbname']
-                    port = db_config.get('port')
-
-                    if db_type == 'postgresql':
-                        connection_url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'mysql':
-                        connection_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'sqlserver':
-                        connection_url = f"mssql+pymssql://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'mariadb':
-                        connection_url = f"mariadb+mariadbconnector://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'oracle':
-                        dsn = f"{host}:{port}/{dbname}"
-                        connection_url = f"oracle+oracledb://{user}:{password}@{dsn}"
-                    elif db_type == 'firebird':
-                        connection_url = f"firebird+fdb://{user}:{password}@{host}:{port}/{dbname}"
-                    else:
-                        raise ValueError(f"Tipo de banco de dados não suportado: '{db_type}'")
-
-                    cls._engine = create_engine(connection_url, **engine_options)
-
-                with cls._engine.connect() as connection:
-                    logging.info(f"Conexão com '{db_type}' estabelecida com sucesso.")
-            except (OperationalError, SQLAlchemyError) as e:
-                logging.error(
-                    f"Erro ao conectar ao banco '{db_type}'. Verifique as credenciais, rede e status do servidor.")
-                raise ConnectionError(f"Não foi possível conectar ao banco '{db_type}'.") from e
-            except KeyError as e:
-                logging.error(f"Parâmetro de configuração faltando no banco.ini para '{db_type}': {e}")
-                raise KeyError(f"Parâmetro '{e}' faltando no 'banco.ini' para a conexão '{db_type}'.") from e
-            except Exception as e:
-                logging.error(f"Erro inesperado durante a configuração do banco: {e}")
-                raise
+            # Double-checked locking: as threads do executor de banco podem pedir a engine ao mesmo tempo.
+            with cls._lock:
+                if cls._engine is None:
+                    cls._engine = cls._create_engine()
         return cls._engine
 
+    @classmethod
+    def _create_engine(cls):
+        try:
+            db_config = cls._parse_active_config()
+            pool_config = cls._parse_pool_config()
+            key = load_key()
+        except (FileNotFoundError, ValueError, RuntimeError) as e:
+            logging.critical(f"Erro ao ler configuração do banco: {e}")
+            raise
+        except Exception as e:
+            logging.critical(f"Falha CRÍTICA ao carregar a chave de segurança: {e}")
+            raise RuntimeError("Não foi possível carregar a chave 'secret.key'.") from e
+
+        db_type = db_config.get('type', 'sqlite').lower()
+        engine_options = {'echo': False, **pool_engine_options(pool_config)}
+        logging.info(f"Configuração ativa detectada: '{db_type}'")
+        logging.info("Pool de conexões: " + ", ".join(f"{k}={v}" for k, v in pool_config.items()))
+        try:
+            connection_url = cls.build_connection_url(db_config, key)
+            if db_type == 'sqlite':
+                sqlite_profile = cls._parse_sqlite_profile()
+                engine_options['connect_args'] = {
+                    'timeout': SQLITE_PROFILES[sqlite_profile]['busy_timeout'] / 1000}
+
+                engine = create_engine(connection_url, **engine_options)
+
+                event.listen(engine, "connect", _sqlite_pragma_listener(sqlite_profile))
+            else:
+                engine = create_engine(connection_url, **engine_options)
+
+            with engine.connect() as connection:
+                logging.info(f"Conexão com '{db_type}' estabelecida com sucesso.")
+                if db_type == 'sqlite':
+                    _log_sqlite_pragmas(connection, sqlite_profile)
+        except (OperationalError, SQLAlchemyError) as e:
+            logging.error(
+                f"Erro ao conectar ao banco '{db_type}'. Verifique as credenciais, rede e status do servidor.")
+            raise ConnectionError(f"Não foi possível conectar ao banco '{db_type}'.") from e
+        except KeyError as e:
+            logging.error(f"Parâmetro de configuração faltando no banco.ini para '{db_type}': {e}")
+            raise KeyError(f"Parâmetro '{e}' faltando no 'banco.ini' para a conexão '{db_type}'.") from e
+        except Exception as e:
+            logging.error(f"Erro inesperado durante a configuração do banco: {e}")
+            raise
+        return engine
+
+    @classmethod
+    def bootstrap_schema(cls, script_path: Path = SCHEMA_PATH) -> dict:
+        """
+        Executa um script de schema (DDL + carga inicial) em uma única transação e retorna o
+        tempo de cada fase em segundos. No SQLite o script inteiro vai em uma só chamada ao
+        executescript do driver; nos demais bancos os comandos são separados por
+        split_statements (literais, comentários, gatilhos, GO e $$ do PostgreSQL). Scripts
+        administrativos com CREATE DATABASE não rodam dentro de transação e devem ser
+        executados pela ferramenta do SGBD.
+        """
+        engine = cls.get_engine()
+        if not engine:
+            raise ConnectionError("Não foi possível executar o script: engine não disponível.")
+        script_path = Path(script_path)
+        if not script_path.is_file():
+            raise FileNotFoundError(f"Arquivo de schema não encontrado em {script_path}")
+
+        timings = {}
+        started = time.perf_counter()
+        script = script_path.read_text(encoding='utf-8')
+        timings['leitura'] = time.perf_counter() - started
+        logging.info(f"Executando o script de schema '{script_path.name}' em '{engine.dialect.name}'...")
+        statement_count = None
+        try:
+            if engine.dialect.name == 'sqlite':
+                raw_connection = engine.raw_connection()
+                try:
+                    driver_connection = raw_connection.driver_connection
+                    started = time.perf_counter()
+                    try:
+                        driver_connection.executescript(f"BEGIN;\n{script}\n;COMMIT;")
+                    except Exception:
+                        if driver_connection.in_transaction:
+                            driver_connection.rollback()
+                        raise
+                    timings['execucao'] = time.perf_counter() - started
+                finally:
+                    raw_connection.close()
+            else:
+                started = time.perf_counter()
+                statements = split_statements(script, engine.dialect.name)
+                timings['divisao'] = time.perf_counter() - started
+                started = time.perf_counter()
+                with engine.begin() as connection:
+                    for statement in statements:
+                        connection.exec_driver_sql(statement)
+                timings['execucao'] = time.perf_counter() - started
+                statement_count = len(statements)
+        except Exception as e:
+            logging.error(f"Erro ao executar o script de schema '{script_path.name}'; transação desfeita. Erro: {e}")
+            raise
+
+        phases = ", ".join(f"{phase}: {seconds * 1000:.1f} ms" for phase, seconds in timings.items())
+        count = f"{statement_count} comandos, " if statement_count is not None else ""
+        logging.info(f"Script de schema '{script_path.name}' executado ({count}{phases}).")
+        return timings
+
     @classmethod
     def initialize_database(cls):
         engine = cls.get_engine()
@@ -118,21 +282,11 @@ class DatabaseManager:
         if engine.url.drivername != 'sqlite':
             logging.info("Inicialização de schema pulada para banco não-SQLite.")
             return
-        db_path = Path(engine.url.database)
-        if db_path.exists() and db_path.stat().st_size > 0:
+        # O tamanho do arquivo não serve de indicador: o PRAGMA journal_mode=WAL já grava o cabeçalho.
+        with engine.connect() as conn:
+            table_count = conn.execute(text("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'")).scalar()
+        if table_count:
             logging.info("Banco de dados SQLite já parece estar inicializado.")
             return
-        if not SCHEMA_PATH.is_file():
-            raise FileNotFoundError(f"Arquivo de schema não encontrado em {SCHEMA_PATH}")
-        logging.info(f"Inicializando banco de dados SQLite a partir de '{SCHEMA_PATH}'...")
-        try:
-            schema_sql = SCHEMA_PATH.read_text(encoding='utf-8')
-            with engine.connect() as conn:
-                for command in schema_sql.split(';'):
-                    if command.strip():
-                        conn.execute(text(command))
-                conn.commit()
-            logging.info("Banco de dados SQLite inicializado com sucesso.")
-        except Exception as e:
-            logging.error(f"Erro ao executar o script de inicialização do SQLite: {e}")
-            raise
\ No newline at end of file
+        cls.bootstrap_schema(SCHEMA_PATH)
+        logging.info("Banco de dados SQLite inicializado com sucesso.")
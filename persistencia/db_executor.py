@@ -0,0 +1,40 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+class DatabaseExecutor:
+    """
+    Pool de threads (Singleton) para as operações de banco disparadas pela interface.
+
+    As consultas rodam fora da thread do Tk, de modo que um servidor lento não congela a janela.
+    O resultado é um concurrent.futures.Future; a entrega à interface é feita por
+    panels.background_task.BackgroundTask, que consulta o Future com after().
+    """
+    _executor = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=config.DB_WORKER_THREADS,
+                                                       thread_name_prefix="db-worker")
+                    logging.info(f"Executor de banco iniciado com {config.DB_WORKER_THREADS} threads.")
+        return cls._executor
+
+    @classmethod
+    def submit(cls, fn, *args, **kwargs):
+        """Agenda 'fn(*args, **kwargs)' em uma thread de trabalho e retorna o Future."""
+        return cls.get_executor().submit(fn, *args, **kwargs)
+
+    @classmethod
+    def shutdown(cls, wait: bool = False):
+        """Encerra o pool, descartando tarefas ainda não iniciadas."""
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logging.info("Executor de banco encerrado.")
@@ -0,0 +1,89 @@
+import logging
+from collections import namedtuple
+
+from sqlalchemy import inspect, text, exc
+
+from .database import DatabaseManager
+
+IndexSpec = namedtuple('IndexSpec', ['name', 'table', 'columns', 'reason'])
+
+# Índices exigidos pelas consultas da aplicação (além das PKs e UNIQUEs dos schemas).
+REQUIRED_INDEXES = [
+    IndexSpec('ix_vegetais_nome_id', 'vegetais', ('nome', 'id'),
+              "busca por nome na reclassificação e paginação ordenada por (nome, id)"),
+    IndexSpec('ix_vegetais_id_tipo', 'vegetais', ('id_tipo',),
+              "JOIN com tipos_vegetais e checagem da FK ao excluir tipos"),
+    IndexSpec('ix_log_alteracoes_timestamp_id', 'log_alteracoes', ('timestamp', 'id'),
+              "trilha de auditoria ordenada por data (paginação por keyset)"),
+    IndexSpec('ix_log_alteracoes_usuario_timestamp', 'log_alteracoes', ('login_usuario', 'timestamp', 'id'),
+              "trilha de auditoria filtrada por usuário, ordenada por data"),
+]
+
+class IndexManager:
+    """
+    Garante a existência dos índices de REQUIRED_INDEXES em qualquer banco suportado.
+
+    A verificação usa o inspector do SQLAlchemy: um índice é considerado presente se algum
+    índice existente da tabela começa pelas mesmas colunas, seja qual for o nome. Só os
+    ausentes são criados, então a operação é idempotente e barata a cada inicialização.
+    """
+
+    @staticmethod
+    def _has_index(existing: list, columns: tuple) -> bool:
+        for index in existing:
+            index_columns = tuple(str(col).lower() for col in index.get('column_names') or () if col)
+            if index_columns[:len(columns)] == columns:
+                return True
+        return False
+
+    @staticmethod
+    def _create_index_sql(engine, spec: IndexSpec) -> str:
+        quote = engine.dialect.identifier_preparer.quote
+        columns = ", ".join(quote(col) for col in spec.columns)
+        return f"CREATE INDEX {quote(spec.name)} ON {quote(spec.table)} ({columns})"
+
+    @classmethod
+    def ensure_indexes(cls, indexes: list = None) -> dict:
+        """
+        Cria os índices ausentes e registra o resultado no log.
+        Retorna {'created': [...], 'existing': [...], 'skipped': [...]} com os nomes dos índices.
+        """
+        engine = DatabaseManager.get_engine()
+        report = {'created': [], 'existing': [], 'skipped': []}
+        if not engine:
+            logging.error("Verificação de índices falhou: engine não disponível.")
+            return report
+
+        inspector = inspect(engine)
+        existing_by_table = {}
+        for spec in indexes or REQUIRED_INDEXES:
+            if spec.table not in existing_by_table:
+                if not inspector.has_table(spec.table):
+                    existing_by_table[spec.table] = None
+                else:
+                    existing = inspector.get_indexes(spec.table)
+                    existing += [{'column_names': uc['column_names']}
+                                 for uc in inspector.get_unique_constraints(spec.table)]
+                    existing.append({'column_names': inspector.get_pk_constraint(spec.table)['constrained_columns']})
+                    existing_by_table[spec.table] = existing
+
+            existing = existing_by_table[spec.table]
+            if existing is None:
+                logging.warning(f"Índice '{spec.name}' ignorado: tabela '{spec.table}' não existe.")
+                report['skipped'].append(spec.name)
+            elif cls._has_index(existing, spec.columns):
+                report['existing'].append(spec.name)
+            else:
+                try:
+                    with engine.begin() as connection:
+                        connection.execute(text(cls._create_index_sql(engine, spec)))
+                except exc.SQLAlchemyError as e:
+                    logging.error(f"Erro ao criar o índice '{spec.name}' em '{spec.table}': {e}")
+                    raise
+                existing.append({'column_names': list(spec.columns)})
+                report['created'].append(spec.name)
+                logging.info(f"Índice '{spec.name}' criado em {spec.table}({', '.join(spec.columns)}): {spec.reason}.")
+
+        logging.info(f"Índices verificados: {len(report['created'])} criados, {len(report['existing'])} já existentes, "
+                     f"{len(report['skipped'])} ignorados.")
+        return report
@@ -0,0 +1,126 @@
+import logging
+import re
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, inspect, select, func, exc
+
+from .database import DatabaseManager
+from .repository import GenericRepository
+from .sql_script import split_statements
+
+MIGRATIONS_PATH = Path(__file__).parent / "migrations"
+BASELINE_VERSION = 0
+
+# Bancos compatíveis compartilham a mesma pasta de migrações.
+DIALECT_DIRECTORIES = {'mariadb': 'mysql'}
+
+_FILENAME_REGEX = re.compile(r'^(\d{4})_(\w+)\.sql$')
+
+Migration = namedtuple('Migration', ['version', 'description', 'path'])
+
+_metadata = MetaData()
+schema_version = Table(
+    'schema_version', _metadata,
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('description', String(255), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+class MigrationManager:
+    """
+    Migrações versionadas do schema.
+
+    Os scripts sql_schema_* formam a versão base (0). Cada alteração posterior é um arquivo
+    persistencia/migrations/<dialeto>/NNNN_descricao.sql, aplicado uma única vez, em ordem,
+    dentro de uma transação junto com o registro na tabela schema_version. Assim a
+    inicialização só executa as diferenças pendentes e nunca recria tabelas nem repete a
+    carga inicial de dados. Em MySQL/MariaDB comandos DDL fazem commit implícito, portanto
+    lá a atomicidade vale apenas para o DML do arquivo.
+    """
+
+    @staticmethod
+    def discover(dialect: str) -> list:
+        """Lista as migrações do dialeto em ordem de versão."""
+        directory = MIGRATIONS_PATH / DIALECT_DIRECTORIES.get(dialect, dialect)
+        if not directory.is_dir():
+            return []
+        migrations = {}
+        for path in sorted(directory.glob("*.sql")):
+            match = _FILENAME_REGEX.match(path.name)
+            if not match:
+                logging.warning(f"Arquivo de migração ignorado (nome fora do padrão NNNN_descricao.sql): {path.name}")
+                continue
+            version = int(match.group(1))
+            if version in migrations:
+                raise ValueError(f"Versão de migração duplicada ({version:04d}) em '{directory}'.")
+            migrations[version] = Migration(version, match.group(2).replace('_', ' '), path)
+        return [migrations[version] for version in sorted(migrations)]
+
+    @staticmethod
+    def current_version(connection):
+        """Retorna a maior versão registrada em schema_version, ou None se a tabela estiver vazia."""
+        return connection.execute(select(func.max(schema_version.c.version))).scalar()
+
+    @classmethod
+    def upgrade(cls) -> list:
+        """Aplica as migrações pendentes e retorna as versões aplicadas."""
+        engine = DatabaseManager.get_engine()
+        if not engine:
+            logging.error("Migrações não executadas: engine não disponível.")
+            return []
+
+        dialect = engine.dialect.name
+        _metadata.create_all(engine, tables=[schema_version], checkfirst=True)
+
+        with engine.begin() as connection:
+            current = cls.current_version(connection)
+            if current is None:
+                application_tables = set(inspect(connection).get_table_names()) - {schema_version.name}
+                if not application_tables:
+                    logging.warning("Banco sem o schema base (sql_schema_*); as migrações não foram aplicadas.")
+                    return []
+                connection.execute(schema_version.insert(), {
+                    'version': BASELINE_VERSION, 'description': 'schema base', 'applied_at': datetime.now()})
+                current = BASELINE_VERSION
+                logging.info("Tabela schema_version criada; banco existente registrado na versão base.")
+
+        migrations = cls.discover(dialect)
+        latest = migrations[-1].version if migrations else BASELINE_VERSION
+        if current > latest:
+            logging.warning(f"O banco está na versão {current}, mais nova que a última migração conhecida ({latest}).")
+        pending = [migration for migration in migrations if migration.version > current]
+        if not pending:
+            logging.info(f"Schema atualizado (versão {current}). Nenhuma migração pendente.")
+            return []
+
+        applied = []
+        try:
+            for migration in pending:
+                started = time.perf_counter()
+                script = migration.path.read_text(encoding='utf-8')
+                try:
+                    with engine.begin() as connection:
+                        if dialect == 'sqlite':
+                            # O driver sqlite3 só abre transação antes de DML; sem o BEGIN explícito
+                            # cada CREATE/ALTER seria confirmado isoladamente.
+                            connection.exec_driver_sql("BEGIN")
+                        for statement in split_statements(script, dialect):
+                            connection.exec_driver_sql(statement)
+                        connection.execute(schema_version.insert(), {
+                            'version': migration.version, 'description': migration.description,
+                            'applied_at': datetime.now()})
+                except exc.SQLAlchemyError as e:
+                    logging.error(f"Falha na migração {migration.version:04d} ({migration.path.name}); "
+                                  f"transação desfeita. Erro: {e}")
+                    raise
+                applied.append(migration.version)
+                logging.info(f"Migração {migration.version:04d} '{migration.description}' aplicada em "
+                             f"{(time.perf_counter() - started) * 1000:.0f} ms.")
+        finally:
+            # Índices textuais podem ter sido criados (ou, no MySQL, parcialmente) pelas migrações.
+            GenericRepository.clear_fulltext_mode_cache()
+        logging.info(f"Schema atualizado da versão {current} para a {applied[-1]}.")
+        return applied
@@ -0,0 +1,8 @@
+-- Sem alteração automática no SQL Server.
+-- A busca textual nativa (CREATE FULLTEXT CATALOG/INDEX) depende do componente Full-Text Search,
+-- ausente em várias instalações (ex.: Express), e não pode ser executada dentro de uma transação.
+-- Nesse banco GenericRepository.search_log_alteracoes usa LIKE. Para habilitar o full-text,
+-- o DBA pode executar manualmente:
+--   CREATE UNIQUE INDEX ux_log_alteracoes_id ON log_alteracoes (id);
+--   CREATE FULLTEXT CATALOG ft_nexlifyttk AS DEFAULT;
+--   CREATE FULLTEXT INDEX ON log_alteracoes (acao) KEY INDEX ux_log_alteracoes_id;
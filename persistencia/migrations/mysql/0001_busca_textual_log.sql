@@ -0,0 +1,2 @@
+-- Índice FULLTEXT (InnoDB) sobre log_alteracoes.acao, consultado com MATCH ... AGAINST.
+ALTER TABLE log_alteracoes ADD FULLTEXT INDEX ft_log_alteracoes_acao (acao);
@@ -0,0 +1,4 @@
+-- Índice GIN de texto completo sobre log_alteracoes.acao (configuração 'portuguese').
+-- A expressão deve ser idêntica à usada em GenericRepository.search_log_alteracoes.
+CREATE INDEX ix_log_alteracoes_acao_fts ON log_alteracoes
+    USING GIN (to_tsvector('portuguese', coalesce(acao, '')));
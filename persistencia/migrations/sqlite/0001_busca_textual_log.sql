@@ -0,0 +1,20 @@
+-- Índice de texto completo (FTS5) sobre log_alteracoes.acao.
+-- Tabela de conteúdo externo: o texto fica só em log_alteracoes; os gatilhos mantêm o índice em sincronia.
+CREATE VIRTUAL TABLE log_alteracoes_fts USING fts5(
+    acao,
+    content='log_alteracoes',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER log_alteracoes_fts_ai AFTER INSERT ON log_alteracoes BEGIN
+    INSERT INTO log_alteracoes_fts (rowid, acao) VALUES (new.id, new.acao);
+END;
+CREATE TRIGGER log_alteracoes_fts_ad AFTER DELETE ON log_alteracoes BEGIN
+    INSERT INTO log_alteracoes_fts (log_alteracoes_fts, rowid, acao) VALUES ('delete', old.id, old.acao);
+END;
+CREATE TRIGGER log_alteracoes_fts_au AFTER UPDATE OF acao ON log_alteracoes BEGIN
+    INSERT INTO log_alteracoes_fts (log_alteracoes_fts, rowid, acao) VALUES ('delete', old.id, old.acao);
+    INSERT INTO log_alteracoes_fts (rowid, acao) VALUES (new.id, new.acao);
+END;
+-- Indexa o histórico já existente.
+INSERT INTO log_alteracoes_fts (log_alteracoes_fts) VALUES ('rebuild');
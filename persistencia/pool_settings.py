@@ -0,0 +1,91 @@
+from sqlalchemy.pool import QueuePool, NullPool, StaticPool, AsyncAdaptedQueuePool
+
+POOL_CLASSES = {
+    'QueuePool': QueuePool,
+    'NullPool': NullPool,
+    'StaticPool': StaticPool,
+}
+
+# Valores padrão do SQLAlchemy: sem a seção [pool] o comportamento da engine não muda.
+POOL_DEFAULTS = {
+    'pool_class': 'QueuePool',
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_timeout': 30.0,
+    'pool_recycle': -1,
+    'pool_pre_ping': False,
+}
+
+_TRUE_VALUES = ('true', 'sim', 'yes', '1', 'on')
+_FALSE_VALUES = ('false', 'nao', 'não', 'no', '0', 'off')
+
+def _parse_int(key: str, value, minimum: int) -> int:
+    try:
+        number = int(str(value).strip())
+    except ValueError:
+        raise ValueError(f"'{key}' deve ser um número inteiro (recebido: '{value}').") from None
+    if number < minimum:
+        raise ValueError(f"'{key}' deve ser maior ou igual a {minimum} (recebido: {number}).")
+    return number
+
+def _parse_bool(key: str, value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"'{key}' deve ser true ou false (recebido: '{value}').")
+
+def validate_pool_settings(raw: dict) -> dict:
+    """
+    Valida os parâmetros da seção [pool] do banco.ini e retorna um dicionário completo e tipado.
+    Chaves ausentes recebem os valores de POOL_DEFAULTS; valores inválidos geram ValueError.
+    """
+    raw = {k.strip().lower(): v for k, v in (raw or {}).items()}
+    unknown = sorted(set(raw) - set(POOL_DEFAULTS))
+    if unknown:
+        raise ValueError(f"Parâmetro(s) de pool desconhecido(s) no banco.ini: {', '.join(unknown)}.")
+
+    settings = dict(POOL_DEFAULTS)
+    if 'pool_class' in raw:
+        pool_class = str(raw['pool_class']).strip()
+        matches = [name for name in POOL_CLASSES if name.lower() == pool_class.lower()]
+        if not matches:
+            raise ValueError(f"'pool_class' inválido: '{pool_class}'. Use {', '.join(POOL_CLASSES)}.")
+        settings['pool_class'] = matches[0]
+    if 'pool_size' in raw:
+        settings['pool_size'] = _parse_int('pool_size', raw['pool_size'], 1)
+    if 'max_overflow' in raw:
+        settings['max_overflow'] = _parse_int('max_overflow', raw['max_overflow'], -1)
+    if 'pool_timeout' in raw:
+        try:
+            settings['pool_timeout'] = float(str(raw['pool_timeout']).strip())
+        except ValueError:
+            raise ValueError(f"'pool_timeout' deve ser um número (recebido: '{raw['pool_timeout']}').") from None
+        if settings['pool_timeout'] <= 0:
+            raise ValueError("'pool_timeout' deve ser maior que zero.")
+    if 'pool_recycle' in raw:
+        settings['pool_recycle'] = _parse_int('pool_recycle', raw['pool_recycle'], -1)
+    if 'pool_pre_ping' in raw:
+        settings['pool_pre_ping'] = _parse_bool('pool_pre_ping', raw['pool_pre_ping'])
+    return settings
+
+def pool_engine_options(settings: dict, use_async: bool = False) -> dict:
+    """
+    Converte as configurações validadas nos argumentos de create_engine (ou create_async_engine).
+    Tamanho, overflow e timeout só existem no QueuePool; recycle e pre-ping valem para todos.
+    """
+    poolclass = POOL_CLASSES[settings['pool_class']]
+    if use_async and poolclass is QueuePool:
+        poolclass = AsyncAdaptedQueuePool
+    options = {
+        'poolclass': poolclass,
+        'pool_recycle': settings['pool_recycle'],
+        'pool_pre_ping': settings['pool_pre_ping'],
+    }
+    if settings['pool_class'] == 'QueuePool':
+        options.update(pool_size=settings['pool_size'], max_overflow=settings['max_overflow'],
+                       pool_timeout=settings['pool_timeout'])
+    return options
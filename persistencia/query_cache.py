@@ -0,0 +1,136 @@
+import re
+import time
+import threading
+from collections import OrderedDict
+
+import config
+
+_TABLE_REGEX = re.compile(r'\b(?:from|join|into|update)\s+([a-zA-Z_][\w.]*)', re.IGNORECASE)
+
+class QueryCache:
+    """
+    Cache de leitura (read-through) para resultados de consultas.
+
+    As entradas são indexadas pelo SQL normalizado e pelos parâmetros, e registram as tabelas
+    citadas na consulta. Qualquer escrita do GenericRepository ou do DataService invalida as
+    entradas das tabelas afetadas. O cache respeita um orçamento de memória (LRU) e um TTL
+    como rede de segurança para alterações feitas por outros clientes do banco.
+    """
+    enabled = config.QUERY_CACHE_ENABLED
+    max_bytes = config.QUERY_CACHE_MAX_MB * 1024 * 1024
+    ttl_seconds = config.QUERY_CACHE_TTL_SECONDS
+
+    _entries = OrderedDict()
+    _keys_by_table = {}
+    _total_bytes = 0
+    _generation = 0
+    _hits = 0
+    _misses = 0
+    _listeners = []
+    _lock = threading.RLock()
+
+    @staticmethod
+    def make_key(query: str, params: dict = None):
+        """Gera a chave do cache a partir do SQL (espaços normalizados) e dos parâmetros."""
+        normalized = " ".join(query.split()).rstrip(';')
+        frozen_params = tuple(sorted((k, repr(v)) for k, v in (params or {}).items()))
+        return normalized, frozen_params
+
+    @staticmethod
+    def tables_in(query: str) -> set:
+        """Extrai os nomes das tabelas citadas em FROM/JOIN/INTO/UPDATE."""
+        return {name.lower().split('.')[-1] for name in _TABLE_REGEX.findall(query)}
+
+    @classmethod
+    def generation(cls) -> int:
+        """Contador incrementado a cada invalidação; usado para descartar leituras concorrentes."""
+        return cls._generation
+
+    @classmethod
+    def get(cls, key):
+        """Retorna uma cópia do DataFrame em cache, ou None se ausente/expirado."""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                cls._misses += 1
+                return None
+            df, tables, size, expires_at = entry
+            if time.monotonic() >= expires_at:
+                cls._remove(key)
+                cls._misses += 1
+                return None
+            cls._entries.move_to_end(key)
+            cls._hits += 1
+        return df.copy()
+
+    @classmethod
+    def put(cls, key, df, generation: int):
+        """Guarda o resultado, a menos que alguma tabela tenha sido invalidada durante a leitura."""
+        size = int(df.memory_usage(deep=True).sum())
+        if size > cls.max_bytes:
+            return
+        tables = cls.tables_in(key[0])
+        with cls._lock:
+            if generation != cls._generation:
+                return
+            if key in cls._entries:
+                cls._remove(key)
+            cls._entries[key] = (df.copy(), tables, size, time.monotonic() + cls.ttl_seconds)
+            cls._total_bytes += size
+            for table in tables:
+                cls._keys_by_table.setdefault(table, set()).add(key)
+            while cls._total_bytes > cls.max_bytes and cls._entries:
+                cls._remove(next(iter(cls._entries)))
+
+    @classmethod
+    def add_listener(cls, listener):
+        """
+        Registra 'listener(*tabelas)', chamado a cada invalidação (sem argumentos em clear()).
+        Permite que outros caches (ex.: ReferenceCache) acompanhem as escritas do repositório.
+        """
+        with cls._lock:
+            if listener not in cls._listeners:
+                cls._listeners.append(listener)
+
+    @classmethod
+    def invalidate(cls, *tables):
+        """Remove do cache todas as consultas que leem alguma das tabelas informadas."""
+        with cls._lock:
+            cls._generation += 1
+            for table in tables:
+                for key in list(cls._keys_by_table.pop(table.lower(), ())):
+                    cls._remove(key)
+            listeners = list(cls._listeners)
+        for listener in listeners:
+            listener(*tables)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._generation += 1
+            cls._entries.clear()
+            cls._keys_by_table.clear()
+            cls._total_bytes = 0
+            listeners = list(cls._listeners)
+        for listener in listeners:
+            listener()
+
+    @classmethod
+    def stats(cls) -> dict:
+        with cls._lock:
+            return {'hits': cls._hits, 'misses': cls._misses, 'entries': len(cls._entries),
+                    'bytes': cls._total_bytes, 'max_bytes': cls.max_bytes}
+
+    @classmethod
+    def _remove(cls, key):
+        entry = cls._entries.pop(key, None)
+        if entry is None:
+            return
+        _, tables, size, _ = entry
+        cls._total_bytes -= size
+        for table in tables:
+            keys = cls._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del cls._keys_by_table[table]
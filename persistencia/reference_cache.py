@@ -0,0 +1,80 @@
+import logging
+import threading
+import time
+
+import config
+from .repository import GenericRepository
+from .query_cache import QueryCache
+
+# Tabelas de referência pequenas: tabela -> (coluna do id, coluna do nome).
+REFERENCE_TABLES = {
+    'tipos_vegetais': ('id', 'nome'),
+}
+
+class ReferenceCache:
+    """
+    Índice em memória nome <-> id das tabelas de referência (REFERENCE_TABLES).
+
+    A tabela inteira é lida uma vez e mantida em dois dicionários, de modo que controllers e
+    o DataService resolvam nomes sem consultar o banco. Qualquer escrita do repositório na
+    tabela invalida o índice (via QueryCache.add_listener); o TTL do query cache cobre as
+    alterações feitas por outros clientes do banco. Com o query cache desligado
+    (query_cache_enabled = False) o índice também não é guardado: cada consulta relê a tabela.
+    """
+    _tables = {}
+    _generations = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get(cls, table_name: str) -> dict:
+        table_name = table_name.lower()
+        with cls._lock:
+            entry = cls._tables.get(table_name)
+            if entry is not None and time.monotonic() < entry['expires_at']:
+                return entry
+            generation = cls._generations.get(table_name, 0)
+
+        if table_name not in REFERENCE_TABLES:
+            raise KeyError(f"Tabela '{table_name}' não está registrada em REFERENCE_TABLES.")
+        id_column, name_column = REFERENCE_TABLES[table_name]
+        df = GenericRepository.read_table_to_dataframe(table_name, columns=[id_column, name_column])
+        ids = [int(value) for value in df[id_column]] if not df.empty else []
+        names = df[name_column].tolist() if not df.empty else []
+        entry = {
+            'id_by_name': dict(zip(names, ids)),
+            'name_by_id': dict(zip(ids, names)),
+            'expires_at': time.monotonic() + config.QUERY_CACHE_TTL_SECONDS,
+        }
+        if not QueryCache.enabled:
+            return entry
+        with cls._lock:
+            # Uma escrita durante a leitura torna o resultado suspeito: usa, mas não guarda.
+            if generation == cls._generations.get(table_name, 0):
+                cls._tables[table_name] = entry
+        logging.debug(f"Índice de referência de '{table_name}' carregado ({len(ids)} registros).")
+        return entry
+
+    @classmethod
+    def id_for(cls, table_name: str, name: str):
+        """Retorna o id correspondente ao nome, ou None se não existir."""
+        return cls._get(table_name)['id_by_name'].get(name)
+
+    @classmethod
+    def name_for(cls, table_name: str, item_id):
+        """Retorna o nome correspondente ao id, ou None se não existir."""
+        return cls._get(table_name)['name_by_id'].get(int(item_id))
+
+    @classmethod
+    def names(cls, table_name: str) -> list:
+        """Lista os nomes em ordem alfabética (ex.: valores de um Combobox)."""
+        return sorted(cls._get(table_name)['id_by_name'])
+
+    @classmethod
+    def invalidate(cls, *tables):
+        """Descarta o índice das tabelas informadas (todas, se nenhuma for informada)."""
+        with cls._lock:
+            for table in [t.lower() for t in tables] or list(REFERENCE_TABLES):
+                cls._generations[table] = cls._generations.get(table, 0) + 1
+                cls._tables.pop(table, None)
+
+QueryCache.add_listener(ReferenceCache.invalidate)
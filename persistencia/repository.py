@@ -1,11 +1,155 @@
 import pandas as pd
-from sqlalchemy import text, exc
+from functools import lru_cache
+from sqlalchemy import text, exc, bindparam, inspect
+from sqlalchemy.sql.elements import TextClause
 import logging
+import re
 import config
 from .database import DatabaseManager
+from .query_cache import QueryCache
+from .audit_writer import AuditWriter
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+DEFAULT_PAGE_SIZE = 200
+BULK_INSERT_CHUNK_SIZE = 1000
+MAX_BIND_PARAMS = 999
+STATEMENT_CACHE_SIZE = 256
+
+_SEARCH_TERM_REGEX = re.compile(r'\w+')
+# Índice textual de log_alteracoes por banco (engine.url); só muda quando há migração.
+_fulltext_modes = {}
+
+def _limit_clause(engine, param_name: str) -> str:
+    """Retorna a cláusula de limite de linhas adequada ao dialeto da engine."""
+    dialect = engine.dialect.name
+    if dialect == 'mssql':
+        return f"OFFSET 0 ROWS FETCH NEXT :{param_name} ROWS ONLY"
+    if dialect in ('oracle', 'firebird'):
+        return f"FETCH FIRST :{param_name} ROWS ONLY"
+    return f"LIMIT :{param_name}"
+
+def _limit_offset_clause(engine, limit_param: str, offset_param: str) -> str:
+    """Retorna a cláusula de limite com deslocamento adequada ao dialeto da engine."""
+    if engine.dialect.name in ('mssql', 'oracle', 'firebird'):
+        return f"OFFSET :{offset_param} ROWS FETCH NEXT :{limit_param} ROWS ONLY"
+    return f"LIMIT :{limit_param} OFFSET :{offset_param}"
+
+def _column_to_python(series: pd.Series) -> list:
+    """Converte uma coluna inteira do DataFrame em valores nativos (NaN/NaT viram None)."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return [None if pd.isna(v) else v.to_pydatetime() for v in series]
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+def _insert_sql(table_name: str, columns: tuple, rows_per_statement: int = 1) -> str:
+    """Monta um INSERT com um (executemany) ou vários grupos de VALUES (multi-row)."""
+    cols_str = ", ".join(columns)
+    if rows_per_statement == 1:
+        values = "(" + ", ".join(f":{col}" for col in columns) + ")"
+    else:
+        values = ", ".join("(" + ", ".join(f":{col}_{i}" for col in columns) + ")"
+                           for i in range(rows_per_statement))
+    return f"INSERT INTO {table_name} ({cols_str}) VALUES {values}"
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _build_statement(kind: str, table_name: str, columns: tuple = (), where_columns: tuple = (), rows: int = 1):
+    """
+    Monta o TextClause de um comando CRUD e o mantém em cache LRU.
+    A chave é a forma do comando (tabela, colunas do SET/projeção, colunas do WHERE), nunca os valores,
+    de modo que chamadas repetidas reaproveitam o mesmo objeto e apenas vinculam novos parâmetros.
+    """
+    where_clause = " AND ".join(f"{col} = :wh_{col}" if kind == 'update' else f"{col} = :{col}"
+                                for col in where_columns)
+    if kind == 'select':
+        cols_str = ", ".join(columns) if columns else "*"
+        query = f"SELECT {cols_str} FROM {table_name}"
+        if where_clause:
+            query += f" WHERE {where_clause}"
+    elif kind == 'update':
+        set_clause = ", ".join(f"{col} = :{col}_val" for col in columns)
+        query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+    elif kind == 'delete':
+        query = f"DELETE FROM {table_name} WHERE {where_clause}"
+    elif kind == 'insert':
+        query = _insert_sql(table_name, columns, rows)
+    else:
+        raise ValueError(f"Tipo de comando desconhecido: '{kind}'")
+    return text(query)
+
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _build_upsert_statement(dialect: str, table_name: str, columns: tuple, conflict_columns: tuple,
+                            update_columns: tuple, rows: int = 1):
+    """
+    Monta o upsert nativo do dialeto para 'rows' registros (parâmetros :{col}_{i}).
+    Sem colunas de atualização, registros já existentes são mantidos como estão.
+    """
+    cols_str = ", ".join(columns)
+    row_groups = ["(" + ", ".join(f":{col}_{i}" for col in columns) + ")" for i in range(rows)]
+
+    if dialect in ('sqlite', 'postgresql'):
+        conflict = ", ".join(conflict_columns)
+        if update_columns:
+            action = "DO UPDATE SET " + ", ".join(f"{col} = excluded.{col}" for col in update_columns)
+        else:
+            action = "DO NOTHING"
+        query = (f"INSERT INTO {table_name} ({cols_str}) VALUES {', '.join(row_groups)} "
+                 f"ON CONFLICT ({conflict}) {action}")
+    elif dialect in ('mysql', 'mariadb'):
+        assignments = [f"{col} = VALUES({col})" for col in update_columns] or \
+                      [f"{conflict_columns[0]} = {conflict_columns[0]}"]
+        query = (f"INSERT INTO {table_name} ({cols_str}) VALUES {', '.join(row_groups)} "
+                 f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}")
+    elif dialect in ('mssql', 'oracle'):
+        on_clause = " AND ".join(f"tgt.{col} = src.{col}" for col in conflict_columns)
+        if dialect == 'mssql':
+            source = f"(VALUES {', '.join(row_groups)}) AS src ({cols_str})"
+            query = f"MERGE INTO {table_name} AS tgt USING {source} ON {on_clause}"
+        else:
+            selects = " UNION ALL ".join(
+                "SELECT " + ", ".join(f":{col}_{i} AS {col}" for col in columns) + " FROM dual"
+                for i in range(rows))
+            query = f"MERGE INTO {table_name} tgt USING ({selects}) src ON ({on_clause})"
+        if update_columns:
+            query += " WHEN MATCHED THEN UPDATE SET " + ", ".join(f"tgt.{col} = src.{col}" for col in update_columns)
+        query += (f" WHEN NOT MATCHED THEN INSERT ({cols_str}) "
+                  f"VALUES ({', '.join(f'src.{col}' for col in columns)})")
+        if dialect == 'mssql':
+            query += ";"
+    elif dialect == 'firebird':
+        # UPDATE OR INSERT sobrescreve todas as colunas enviadas; não há como restringir o UPDATE.
+        if set(update_columns) != set(columns) - set(conflict_columns):
+            raise ValueError("No Firebird o upsert (UPDATE OR INSERT) atualiza todas as colunas fora do "
+                             "conflito; 'update_columns' parcial ou vazio não é suportado.")
+        query = (f"UPDATE OR INSERT INTO {table_name} ({cols_str}) VALUES {row_groups[0]} "
+                 f"MATCHING ({', '.join(conflict_columns)})")
+    else:
+        raise ValueError(f"Upsert não suportado para o dialeto: '{dialect}'")
+    return text(query)
+
+def _to_python(value):
+    """Converte escalares numpy/pandas em tipos nativos aceitos pelos drivers DBAPI."""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+def _audit_in_transaction(connection, audit: tuple):
+    """No modo 'strict' grava o registro de auditoria na transação da própria alteração."""
+    if audit and AuditWriter.is_strict():
+        AuditWriter.write(connection, *audit)
+
+def _audit_after_commit(audit: tuple):
+    """Após o commit: no modo 'queued' enfileira o registro; no 'strict' só invalida o cache do log."""
+    if not audit:
+        return
+    if AuditWriter.is_strict():
+        QueryCache.invalidate('log_alteracoes')
+    else:
+        AuditWriter.enqueue(*audit)
+
 class GenericRepository:
     """
     Classe genérica para interagir com o banco de dados.
@@ -18,8 +162,29 @@ class GenericRepository:
         return DatabaseManager.get_engine()
 
     @staticmethod
-    def execute_query_to_dataframe(query: str, params: dict = None):
-        """Executa uma query e retorna um DataFrame com colunas minúsculas."""
+    def statement_cache_info() -> dict:
+        """Retorna os contadores do cache de comandos (acertos, faltas e ocupação)."""
+        info = _build_statement.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+
+    @staticmethod
+    def clear_statement_cache():
+        """Esvazia o cache de comandos e zera seus contadores."""
+        _build_statement.cache_clear()
+
+    @staticmethod
+    def clear_fulltext_mode_cache():
+        """Descarta o índice textual detectado; chamado após migrações que alteram o schema."""
+        _fulltext_modes.clear()
+
+    @staticmethod
+    def execute_query_to_dataframe(query, params: dict = None, use_cache: bool = True, parse_dates: list = None):
+        """
+        Executa uma query e retorna um DataFrame com colunas minúsculas.
+        O resultado passa pelo QueryCache, salvo quando use_cache=False ou o cache está desligado.
+        As colunas em 'parse_dates' chegam como datetime64: objetos datetime do driver são
+        mantidos e textos ISO 8601 (SQLite) são convertidos uma única vez, na leitura.
+        """
         if not config.DATABASE_ENABLED:
             logging.warning("Banco de dados desabilitado. A query não será executada.")
             return pd.DataFrame()
@@ -29,19 +194,182 @@ class GenericRepository:
             logging.error("Acesso ao banco falhou: engine não disponível.")
             return pd.DataFrame()
 
+        statement = query if isinstance(query, TextClause) else text(query)
+        cache_key = None
+        if use_cache and QueryCache.enabled:
+            cache_key = QueryCache.make_key(statement.text, params) + (tuple(parse_dates or ()),)
+            cached_df = QueryCache.get(cache_key)
+            if cached_df is not None:
+                return cached_df
+            generation = QueryCache.generation()
+
         try:
             with engine.connect() as connection:
-                df = pd.read_sql_query(text(query), connection, params=params)
+                df = pd.read_sql_query(statement, connection, params=params, parse_dates=(
+                    {column: {'format': 'ISO8601'} for column in parse_dates} if parse_dates else None))
                                                      
                 df.columns = [str(col).lower() for col in df.columns]
-                return df
+            if cache_key is not None:
+                QueryCache.put(cache_key, df, generation)
+            return df
         except exc.SQLAlchemyError as e:
             logging.error(f"Erro ao executar a query: {query}\nErro: {e}")
             raise
 
     @staticmethod
-    def write_dataframe_to_table(df: pd.DataFrame, table_name: str):
-        """Escreve um DataFrame em uma tabela (espera nome da tabela minúsculo)."""
+    def iter_query(query, params: dict = None, chunk_size: int = BULK_INSERT_CHUNK_SIZE, as_dataframe: bool = False):
+        """
+        Executa uma query em modo streaming (cursor do lado do servidor quando o driver suporta)
+        e produz o resultado aos poucos: tuplas, uma por linha, ou DataFrames de até 'chunk_size'
+        linhas com colunas minúsculas. A memória fica limitada ao tamanho do lote.
+        O resultado não passa pelo QueryCache.
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning("Banco de dados desabilitado. A query não será executada.")
+            return
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error("Acesso ao banco falhou: engine não disponível.")
+            return
+
+        statement = query if isinstance(query, TextClause) else text(query)
+        try:
+            with engine.connect() as connection:
+                result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(
+                    statement, params or {})
+                columns = [str(col).lower() for col in result.keys()]
+                for partition in result.partitions(chunk_size):
+                    if as_dataframe:
+                        yield pd.DataFrame.from_records(partition, columns=columns)
+                    else:
+                        yield from (tuple(row) for row in partition)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao executar a query em streaming: {query}\nErro: {e}")
+            raise
+
+    @staticmethod
+    def write_dataframe_to_table(df: pd.DataFrame, table_name: str, chunksize: int = None, method: str = None):
+        """
+        Escreve um DataFrame em uma tabela (espera nome da tabela minúsculo).
+
+        A carga é feita em uma única transação, em lotes de 'chunksize' linhas. Por padrão cada
+        lote é enviado com executemany; com method='multi' cada lote vira INSERTs com vários
+        grupos de VALUES, limitados a MAX_BIND_PARAMS parâmetros por comando.
+        Retorna a quantidade de registros inseridos.
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será escrito em '{table_name}'.")
+            return 0
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Escrita em '{table_name}' falhou: engine não disponível.")
+            return 0
+
+        if method not in (None, 'multi'):
+            raise ValueError(f"Método de inserção inválido: '{method}'. Use None ou 'multi'.")
+        if df.empty:
+            return 0
+
+        columns = tuple(str(col).lower() for col in df.columns)
+        records = list(zip(*[_column_to_python(df.iloc[:, i]) for i in range(len(columns))]))
+        chunksize = chunksize or BULK_INSERT_CHUNK_SIZE
+
+        try:
+            with engine.begin() as connection:
+                if method == 'multi':
+                    rows_per_statement = max(1, min(chunksize, MAX_BIND_PARAMS // len(columns)))
+                    for start in range(0, len(records), rows_per_statement):
+                        chunk = records[start:start + rows_per_statement]
+                        params = {f"{col}_{i}": value
+                                  for i, record in enumerate(chunk) for col, value in zip(columns, record)}
+                        connection.execute(_build_statement('insert', table_name, columns, rows=len(chunk)), params)
+                else:
+                    statement = _build_statement('insert', table_name, columns)
+                    for start in range(0, len(records), chunksize):
+                        chunk = records[start:start + chunksize]
+                        connection.execute(statement, [dict(zip(columns, record)) for record in chunk])
+            QueryCache.invalidate(table_name)
+            logging.info(f"{len(records)} registros inseridos com sucesso na tabela '{table_name}'.")
+            return len(records)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao escrever na tabela '{table_name}'. Colunas do DF: {list(df.columns)}. Erro: {e}")
+            raise
+
+    @staticmethod
+    def upsert_dataframe(df: pd.DataFrame, table_name: str, conflict_columns, update_columns: list = None,
+                         chunksize: int = None):
+        """
+        Insere ou atualiza (upsert) os registros do DataFrame usando o comando nativo do dialeto:
+        ON CONFLICT (SQLite/PostgreSQL), ON DUPLICATE KEY UPDATE (MySQL/MariaDB), MERGE
+        (SQL Server/Oracle) ou UPDATE OR INSERT (Firebird). 'conflict_columns' deve corresponder
+        a uma PK ou restrição UNIQUE.
+
+        Por padrão todas as colunas fora do conflito são atualizadas; update_columns=[] apenas
+        insere os registros novos. No Firebird só o padrão é aceito (ValueError caso contrário). Cada lote é um único comando com vários grupos de VALUES,
+        limitado a MAX_BIND_PARAMS parâmetros, e toda a carga roda em uma única transação.
+        Linhas repetidas na chave de conflito prevalecem pela última ocorrência.
+        Retorna a quantidade de registros enviados.
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será escrito em '{table_name}'.")
+            return 0
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Upsert em '{table_name}' falhou: engine não disponível.")
+            return 0
+
+        if isinstance(conflict_columns, str):
+            conflict_columns = [conflict_columns]
+        columns = tuple(str(col).lower() for col in df.columns)
+        conflict_columns = tuple(col.lower() for col in conflict_columns)
+        missing = [col for col in conflict_columns if col not in columns]
+        if not conflict_columns or missing:
+            raise ValueError(f"Colunas de conflito ausentes no DataFrame: {missing or 'nenhuma informada'}.")
+        if update_columns is None:
+            update_columns = tuple(col for col in columns if col not in conflict_columns)
+        else:
+            update_columns = tuple(col.lower() for col in update_columns)
+        if df.empty:
+            return 0
+
+        df = df.set_axis(list(columns), axis=1).drop_duplicates(subset=list(conflict_columns), keep='last')
+        records = list(zip(*[_column_to_python(df.iloc[:, i]) for i in range(len(columns))]))
+        dialect = engine.dialect.name
+        chunksize = chunksize or BULK_INSERT_CHUNK_SIZE
+
+        try:
+            with engine.begin() as connection:
+                if dialect == 'firebird':
+                    # UPDATE OR INSERT aceita uma linha por comando: cada lote vai em um executemany.
+                    statement = _build_upsert_statement(dialect, table_name, columns, conflict_columns, update_columns)
+                    for start in range(0, len(records), chunksize):
+                        connection.execute(statement, [{f"{col}_0": value for col, value in zip(columns, record)}
+                                                       for record in records[start:start + chunksize]])
+                else:
+                    rows_per_statement = max(1, min(chunksize, MAX_BIND_PARAMS // len(columns)))
+                    for start in range(0, len(records), rows_per_statement):
+                        chunk = records[start:start + rows_per_statement]
+                        statement = _build_upsert_statement(dialect, table_name, columns, conflict_columns,
+                                                            update_columns, rows=len(chunk))
+                        params = {f"{col}_{i}": value
+                                  for i, record in enumerate(chunk) for col, value in zip(columns, record)}
+                        connection.execute(statement, params)
+            QueryCache.invalidate(table_name)
+            logging.info(f"Upsert de {len(records)} registros concluído na tabela '{table_name}'.")
+            return len(records)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro no upsert da tabela '{table_name}'. Colunas do DF: {list(df.columns)}. Erro: {e}")
+            raise
+
+    @staticmethod
+    def insert_row(table_name: str, values: dict, audit: tuple = None):
+        """
+        Insere um único registro a partir de um dicionário, sem passar pelo pandas.
+        'audit' = (login_usuario, acao) registra a operação na trilha de auditoria (ver AuditWriter).
+        """
         if not config.DATABASE_ENABLED:
             logging.warning(f"Banco de dados desabilitado. Nenhum dado será escrito em '{table_name}'.")
             return
@@ -51,21 +379,24 @@ class GenericRepository:
             logging.error(f"Escrita em '{table_name}' falhou: engine não disponível.")
             return
 
+        params = {k.lower(): v for k, v in values.items()}
         try:
-                                                                                
-            df_to_write = df.copy()
-            df_to_write.columns = [str(col).lower() for col in df_to_write.columns]
-                                                                      
-            df_to_write.to_sql(table_name, con=engine, if_exists='append', index=False)
-            logging.info(f"{len(df)} registros inseridos com sucesso na tabela '{table_name}'.")
+            with engine.begin() as connection:
+                connection.execute(_build_statement('insert', table_name, tuple(params)), params)
+                _audit_in_transaction(connection, audit)
+            QueryCache.invalidate(table_name)
+            _audit_after_commit(audit)
+            logging.info(f"1 registro inserido com sucesso na tabela '{table_name}'.")
         except exc.SQLAlchemyError as e:
-                                                   
-            logging.error(f"Erro ao escrever na tabela '{table_name}'. Colunas do DF: {list(df.columns)}. Erro: {e}")
+            logging.error(f"Erro ao inserir na tabela '{table_name}'. Colunas: {list(values)}. Erro: {e}")
             raise
 
     @staticmethod
-    def update_table(table_name: str, update_values: dict, where_conditions: dict):
-        """Atualiza registros em uma tabela (espera nome da tabela e chaves minúsculas)."""
+    def update_table(table_name: str, update_values: dict, where_conditions: dict, audit: tuple = None):
+        """
+        Atualiza registros em uma tabela (espera nome da tabela e chaves minúsculas).
+        'audit' = (login_usuario, acao) registra a operação na trilha de auditoria.
+        """
         if not config.DATABASE_ENABLED:
             logging.warning(f"Banco de dados desabilitado. Nenhum dado será atualizado em '{table_name}'.")
             return
@@ -75,29 +406,32 @@ class GenericRepository:
             logging.error(f"Update em '{table_name}' falhou: engine não disponível.")
             return
 
-        update_values_lower = {k.lower(): v for k, v in update_values.items()}
-        where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
+        set_columns = tuple(k.lower() for k in update_values)
+        where_columns = tuple(k.lower() for k in where_conditions)
 
-        set_clause = ", ".join([f"{key} = :{key}_val" for key in update_values_lower.keys()])
-        where_clause = " AND ".join([f"{key} = :wh_{key}" for key in where_conditions_lower.keys()])
+        params = {f'{k}_val': v for k, v in zip(set_columns, update_values.values())}
+        params.update({f'wh_{k}': v for k, v in zip(where_columns, where_conditions.values())})
 
-        params = {f'{k}_val': v for k, v in update_values_lower.items()}
-        params.update({f'wh_{k}': v for k, v in where_conditions_lower.items()})
-
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+        statement = _build_statement('update', table_name, set_columns, where_columns)
 
         try:
             with engine.connect() as connection:
                 with connection.begin():
-                    connection.execute(text(query), params)
+                    connection.execute(statement, params)
+                    _audit_in_transaction(connection, audit)
+            QueryCache.invalidate(table_name)
+            _audit_after_commit(audit)
             logging.info(f"Tabela '{table_name}' atualizada com sucesso.")
         except exc.SQLAlchemyError as e:
             logging.error(f"Erro ao atualizar a tabela '{table_name}': {e}")
             raise
 
     @staticmethod
-    def delete_from_table(table_name: str, where_conditions: dict):
-        """Deleta registros de uma tabela (espera nome da tabela e chaves minúsculas)."""
+    def delete_from_table(table_name: str, where_conditions: dict, audit: tuple = None):
+        """
+        Deleta registros de uma tabela (espera nome da tabela e chaves minúsculas).
+        'audit' = (login_usuario, acao) registra a operação na trilha de auditoria.
+        """
         if not config.DATABASE_ENABLED:
             logging.warning(f"Banco de dados desabilitado. Nenhum dado será deletado de '{table_name}'.")
             return
@@ -107,22 +441,105 @@ class GenericRepository:
             logging.error(f"Delete em '{table_name}' falhou: engine não disponível.")
             return
 
-        where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
-
-        where_clause = " AND ".join([f"{key} = :{key}" for key in where_conditions_lower.keys()])
-        params = where_conditions_lower
-
-        query = f"DELETE FROM {table_name} WHERE {where_clause}"
+        params = {k.lower(): v for k, v in where_conditions.items()}
+        statement = _build_statement('delete', table_name, where_columns=tuple(params))
 
         try:
             with engine.connect() as connection:
                 with connection.begin():
-                    connection.execute(text(query), params)
+                    connection.execute(statement, params)
+                    _audit_in_transaction(connection, audit)
+            QueryCache.invalidate(table_name)
+            _audit_after_commit(audit)
             logging.info(f"Registros da tabela '{table_name}' deletados com sucesso.")
         except exc.SQLAlchemyError as e:
             logging.error(f"Erro ao deletar da tabela '{table_name}': {e}")
             raise
 
+    @staticmethod
+    def update_many(table_name: str, updates: list, chunk_size: int = BULK_INSERT_CHUNK_SIZE) -> list:
+        """
+        Aplica vários updates em uma única transação.
+
+        'updates' é uma lista de pares (update_values, where_conditions), como em update_table.
+        Os itens são agrupados pela forma do comando (colunas do SET e do WHERE) e cada grupo é
+        enviado com executemany em lotes de 'chunk_size'. Retorna a quantidade de linhas afetadas
+        por lote, na ordem de execução.
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será atualizado em '{table_name}'.")
+            return []
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Update em lote em '{table_name}' falhou: engine não disponível.")
+            return []
+
+        groups = {}
+        for update_values, where_conditions in updates:
+            set_columns = tuple(k.lower() for k in update_values)
+            where_columns = tuple(k.lower() for k in where_conditions)
+            params = {f'{k}_val': _to_python(v) for k, v in zip(set_columns, update_values.values())}
+            params.update({f'wh_{k}': _to_python(v) for k, v in zip(where_columns, where_conditions.values())})
+            groups.setdefault((set_columns, where_columns), []).append(params)
+
+        rowcounts = []
+        try:
+            with engine.begin() as connection:
+                for (set_columns, where_columns), group in groups.items():
+                    statement = _build_statement('update', table_name, set_columns, where_columns)
+                    for start in range(0, len(group), chunk_size):
+                        result = connection.execute(statement, group[start:start + chunk_size])
+                        rowcounts.append(result.rowcount)
+            if rowcounts:
+                QueryCache.invalidate(table_name)
+            logging.info(f"Update em lote na tabela '{table_name}': {len(updates)} itens, "
+                         f"{sum(rowcounts)} linhas afetadas em {len(rowcounts)} lotes.")
+            return rowcounts
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro no update em lote da tabela '{table_name}': {e}")
+            raise
+
+    @staticmethod
+    def delete_many(table_name: str, key_column: str, ids: list, chunk_size: int = MAX_BIND_PARAMS) -> list:
+        """
+        Deleta os registros cujas chaves estão em 'ids', em uma única transação.
+
+        As chaves são enviadas em lotes de 'chunk_size' com DELETE ... WHERE key IN (...),
+        respeitando o limite de parâmetros por comando. Retorna a quantidade de linhas
+        deletadas por lote.
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será deletado de '{table_name}'.")
+            return []
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Delete em lote em '{table_name}' falhou: engine não disponível.")
+            return []
+
+        ids = [_to_python(v) for v in dict.fromkeys(ids)]
+        if not ids:
+            return []
+
+        key_column = key_column.lower()
+        statement = text(f"DELETE FROM {table_name} WHERE {key_column} IN :ids").bindparams(
+            bindparam('ids', expanding=True))
+
+        rowcounts = []
+        try:
+            with engine.begin() as connection:
+                for start in range(0, len(ids), chunk_size):
+                    result = connection.execute(statement, {'ids': ids[start:start + chunk_size]})
+                    rowcounts.append(result.rowcount)
+            QueryCache.invalidate(table_name)
+            logging.info(f"Delete em lote na tabela '{table_name}': "
+                         f"{sum(rowcounts)} registros deletados em {len(rowcounts)} lotes.")
+            return rowcounts
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro no delete em lote da tabela '{table_name}': {e}")
+            raise
+
     @staticmethod
     def read_vegetais_com_tipo():
         """Busca todos os vegetais com o nome do tipo (usa nomes minúsculos)."""
@@ -141,19 +558,232 @@ class GenericRepository:
         if not config.DATABASE_ENABLED:
             return pd.DataFrame()
 
-        cols_str = "*"
-        if columns:
-             cols_lower = [col.lower() for col in columns]
-             cols_str = ", ".join(cols_lower)
+        projection = tuple(col.lower() for col in columns) if columns else ()
+        params_lower = {k.lower(): v for k, v in where_conditions.items()} if where_conditions else None
+        statement = _build_statement('select', table_name, projection, tuple(params_lower or ()))
 
-        query = f"SELECT {cols_str} FROM {table_name}"
+        return GenericRepository.execute_query_to_dataframe(statement, params=params_lower)
+
+    @staticmethod
+    def _read_page(select_sql: str, sort_expr: str, key_expr: str, sort_col: str, key_col: str,
+                   page_size: int, after: tuple, descending: bool, conditions: list = None, params: dict = None,
+                   parse_dates: list = None):
+        """
+        Executa uma leitura paginada por chave (keyset/seek) e devolve (DataFrame, token).
+        A ordenação é feita por (sort_expr, key_expr), o que mantém a paginação estável mesmo
+        quando a coluna de ordenação não é única.
+        """
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame(), None
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error("Leitura paginada falhou: engine não disponível.")
+            return pd.DataFrame(), None
+
+        if page_size <= 0:
+            raise ValueError("O tamanho da página deve ser maior que zero.")
+
+        conditions = list(conditions or [])
+        params = dict(params or {})
+        comparator = "<" if descending else ">"
+        single_key = sort_expr == key_expr
 
-        params_lower = None
+        if after is not None:
+            if single_key:
+                conditions.append(f"{key_expr} {comparator} :pg_key")
+                params['pg_key'] = after[-1]
+            else:
+                conditions.append(f"({sort_expr} {comparator} :pg_sort OR "
+                                  f"({sort_expr} = :pg_sort AND {key_expr} {comparator} :pg_key))")
+                params['pg_sort'], params['pg_key'] = after[0], after[-1]
+
+        direction = "DESC" if descending else "ASC"
+        order_clause = f"{key_expr} {direction}" if single_key else f"{sort_expr} {direction}, {key_expr} {direction}"
+
+        query = select_sql
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_clause} {_limit_clause(engine, 'pg_limit')}"
+        params['pg_limit'] = page_size + 1
+
+        df = GenericRepository.execute_query_to_dataframe(query, params=params, parse_dates=parse_dates)
+
+        next_token = None
+        if len(df) > page_size:
+            df = df.iloc[:page_size]
+            last_row = df.iloc[-1]
+            key_value = _to_python(last_row[key_col])
+            next_token = (key_value,) if single_key else (_to_python(last_row[sort_col]), key_value)
+        return df.reset_index(drop=True), next_token
+
+    @staticmethod
+    def read_table_page(table_name: str, page_size: int = DEFAULT_PAGE_SIZE, after: tuple = None,
+                        order_by: str = 'id', key_column: str = 'id', descending: bool = False,
+                        columns: list = None, where_conditions: dict = None):
+        """
+        Lê uma página de uma tabela (espera nomes minúsculos) usando paginação por chave.
+
+        Retorna uma tupla (DataFrame, token). Para obter a página seguinte, passe o token
+        recebido no parâmetro 'after'; quando não há mais registros o token é None.
+        A coluna 'order_by' deve ser NOT NULL e 'key_column' deve ser única (ex.: a PK).
+        """
+        order_by = order_by.lower()
+        key_column = key_column.lower()
+
+        extra_cols = []
+        if columns:
+            cols_lower = [col.lower() for col in columns]
+            extra_cols = [col for col in dict.fromkeys((order_by, key_column)) if col not in cols_lower]
+            cols_str = ", ".join(cols_lower + extra_cols)
+        else:
+            cols_str = "*"
+
+        conditions, params = [], {}
         if where_conditions:
-                                                                              
-            where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
-            conditions = " AND ".join([f"{key} = :{key}" for key in where_conditions_lower.keys()])
-            query += f" WHERE {conditions}"
-            params_lower = where_conditions_lower                                         
+            for key, value in where_conditions.items():
+                conditions.append(f"{key.lower()} = :{key.lower()}")
+                params[key.lower()] = value
+
+        df, next_token = GenericRepository._read_page(
+            f"SELECT {cols_str} FROM {table_name}", order_by, key_column, order_by, key_column,
+            page_size, after, descending, conditions, params)
+
+        if extra_cols and not df.empty:
+            df = df.drop(columns=extra_cols)
+        return df, next_token
+
+    @staticmethod
+    def read_vegetais_com_tipo_page(page_size: int = DEFAULT_PAGE_SIZE, after: tuple = None):
+        """Versão paginada de read_vegetais_com_tipo, ordenada por (nome, id)."""
+        query = """
+                SELECT v.id, v.nome, tv.nome as tipo
+                FROM vegetais v
+                         LEFT JOIN tipos_vegetais tv ON v.id_tipo = tv.id
+                """
+        return GenericRepository._read_page(query, "v.nome", "v.id", "nome", "id", page_size, after, False)
+
+    @staticmethod
+    def read_log_alteracoes_page(page_size: int = DEFAULT_PAGE_SIZE, after: tuple = None,
+                                 login_usuario: str = None, data_inicio=None, data_fim=None):
+        """
+        Lê uma página da trilha de auditoria, da alteração mais recente para a mais antiga
+        (ORDER BY timestamp DESC, id DESC), no contrato de read_table_page.
+
+        Filtros opcionais: 'login_usuario' (igualdade) e o intervalo [data_inicio, data_fim),
+        com data_fim exclusiva. Ordenação, filtros e limite são resolvidos no banco pelos
+        índices (timestamp, id) e (login_usuario, timestamp, id). A coluna 'timestamp' vem
+        como datetime64, em todos os bancos.
+        """
+        conditions, params = [], {}
+        if login_usuario:
+            conditions.append("login_usuario = :login_usuario")
+            params['login_usuario'] = login_usuario
+        if data_inicio is not None:
+            conditions.append("timestamp >= :data_inicio")
+            params['data_inicio'] = data_inicio
+        if data_fim is not None:
+            conditions.append("timestamp < :data_fim")
+            params['data_fim'] = data_fim
+        query = "SELECT id, timestamp, login_usuario, acao FROM log_alteracoes"
+        return GenericRepository._read_page(query, "timestamp", "id", "timestamp", "id", page_size, after, True,
+                                            conditions, params, parse_dates=['timestamp'])
+
+    @staticmethod
+    def _log_fulltext_mode(engine) -> str:
+        """
+        Identifica o índice textual de log_alteracoes disponível (ver persistencia/migrations).
+        A inspeção do banco é feita uma vez por engine.url; clear_fulltext_mode_cache() a refaz.
+        """
+        mode = _fulltext_modes.get(engine.url)
+        if mode is None:
+            mode = GenericRepository._detect_fulltext_mode(engine)
+            _fulltext_modes[engine.url] = mode
+        return mode
+
+    @staticmethod
+    def _detect_fulltext_mode(engine) -> str:
+        dialect = engine.dialect.name
+        if dialect == 'postgresql':
+            return 'postgresql'
+        inspector = inspect(engine)
+        if dialect == 'sqlite' and inspector.has_table('log_alteracoes_fts'):
+            return 'sqlite'
+        if dialect in ('mysql', 'mariadb') and any(
+                index['name'] == 'ft_log_alteracoes_acao' for index in inspector.get_indexes('log_alteracoes')):
+            return 'mysql'
+        return 'like'
+
+    @staticmethod
+    def search_log_alteracoes(termo: str, page_size: int = DEFAULT_PAGE_SIZE, after: int = None,
+                              login_usuario: str = None, data_inicio=None, data_fim=None):
+        """
+        Busca textual em log_alteracoes.acao, dos resultados mais relevantes para os menos
+        relevantes, com os mesmos filtros de read_log_alteracoes_page.
+
+        Cada palavra do termo é exigida como prefixo (ex.: "alf tom" encontra "Alface" e
+        "Tomate"). Usa o FTS5 no SQLite, to_tsvector/ts_rank no PostgreSQL e MATCH ... AGAINST
+        no MySQL/MariaDB; nos demais bancos recorre a LIKE, ordenado por data. Como a ordem
+        por relevância não é estável para keyset, a paginação é por deslocamento: 'after' é o
+        token devolvido pela página anterior. Retorna (DataFrame, token) como read_table_page,
+        com 'timestamp' em datetime64.
+        """
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame(), None
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error("Busca no log de auditoria falhou: engine não disponível.")
+            return pd.DataFrame(), None
+
+        if page_size <= 0:
+            raise ValueError("O tamanho da página deve ser maior que zero.")
+        palavras = _SEARCH_TERM_REGEX.findall(termo or "")
+        if not palavras:
+            return pd.DataFrame(columns=['id', 'timestamp', 'login_usuario', 'acao']), None
+
+        conditions, params = [], {}
+        if login_usuario:
+            conditions.append("l.login_usuario = :login_usuario")
+            params['login_usuario'] = login_usuario
+        if data_inicio is not None:
+            conditions.append("l.timestamp >= :data_inicio")
+            params['data_inicio'] = data_inicio
+        if data_fim is not None:
+            conditions.append("l.timestamp < :data_fim")
+            params['data_fim'] = data_fim
+
+        select_sql = "SELECT l.id, l.timestamp, l.login_usuario, l.acao FROM log_alteracoes l"
+        mode = GenericRepository._log_fulltext_mode(engine)
+        if mode == 'sqlite':
+            select_sql += " JOIN log_alteracoes_fts f ON f.rowid = l.id"
+            conditions.append("log_alteracoes_fts MATCH :termo")
+            params['termo'] = " ".join('"' + palavra.replace('"', '""') + '"*' for palavra in palavras)
+            order_clause = "bm25(log_alteracoes_fts), l.id DESC"
+        elif mode == 'postgresql':
+            document = "to_tsvector('portuguese', coalesce(l.acao, ''))"
+            conditions.append(f"{document} @@ to_tsquery('portuguese', :termo)")
+            params['termo'] = " & ".join(f"{palavra}:*" for palavra in palavras)
+            order_clause = f"ts_rank({document}, to_tsquery('portuguese', :termo)) DESC, l.id DESC"
+        elif mode == 'mysql':
+            match = "MATCH (l.acao) AGAINST (:termo IN BOOLEAN MODE)"
+            conditions.append(match)
+            params['termo'] = " ".join(f"+{palavra}*" for palavra in palavras)
+            order_clause = f"{match} DESC, l.id DESC"
+        else:
+            for i, palavra in enumerate(palavras):
+                conditions.append(f"LOWER(l.acao) LIKE :termo_{i}")
+                params[f'termo_{i}'] = f"%{palavra.lower()}%"
+            order_clause = "l.timestamp DESC, l.id DESC"
+
+        offset = after or 0
+        query = (f"{select_sql} WHERE {' AND '.join(conditions)} ORDER BY {order_clause} "
+                 f"{_limit_offset_clause(engine, 'pg_limit', 'pg_offset')}")
+        params.update(pg_limit=page_size + 1, pg_offset=offset)
 
-        return GenericRepository.execute_query_to_dataframe(query, params=params_lower)
\ No newline at end of file
+        df = GenericRepository.execute_query_to_dataframe(query, params=params, parse_dates=['timestamp'])
+        next_token = None
+        if len(df) > page_size:
+            df = df.iloc[:page_size]
+            next_token = offset + page_size
+        return df.reset_index(drop=True), next_token
@@ -51,6 +51,9 @@ CREATE TABLE especie_gatos (
     pais_origem VARCHAR(255),
     temperamento VARCHAR(255)
 );
+CREATE INDEX ix_vegetais_nome_id ON vegetais (nome, id);
+CREATE INDEX ix_vegetais_id_tipo ON vegetais (id_tipo);
+CREATE INDEX ix_log_alteracoes_timestamp_id ON log_alteracoes (timestamp, id);
 GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO gato;
 GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO gato;
 INSERT INTO usuarios (login_usuario, senha_criptografada, nome_completo, tipo_acesso) VALUES
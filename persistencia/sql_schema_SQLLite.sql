@@ -39,6 +39,9 @@ CREATE TABLE especie_gatos (
     pais_origem TEXT,
     temperamento TEXT
 );
+CREATE INDEX ix_vegetais_nome_id ON vegetais (nome, id);
+CREATE INDEX ix_vegetais_id_tipo ON vegetais (id_tipo);
+CREATE INDEX ix_log_alteracoes_timestamp_id ON log_alteracoes (timestamp, id);
 INSERT INTO usuarios (login_usuario, senha_criptografada, nome_completo, tipo_acesso) VALUES
 ('admin', '$2b$12$TgcQ51usbRmBjfGtris6eueXiKMbJpfSpsFpuyM4QE/qwqmcEX9By', 'Usuário Administrador', 'Administrador Global'),
 ('dev_user', '$2b$12$TgcQ51usbRmBjfGtris6eueXiKMbJpfSpsFpuyM4QE/qwqmcEX9By', 'Usuário de Desenvolvimento', 'Administrador Global'),
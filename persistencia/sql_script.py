@@ -0,0 +1,111 @@
+import re
+
+_WORD_REGEX = re.compile(r'[A-Za-z_][A-Za-z0-9_$]*')
+_DOLLAR_TAG_REGEX = re.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)?\$')
+_GO_LINE_REGEX = re.compile(r'[ \t]*GO(?:[ \t]+\d+)?[ \t]*(?:--[^\n]*)?(?=\r?\n|$)', re.IGNORECASE)
+
+# Comandos cujo corpo é um bloco BEGIN ... END com ';' internos (gatilhos e rotinas).
+_COMPOUND_REGEX = re.compile(
+    r'CREATE\s+(?:OR\s+REPLACE\s+)?(?:DEFINER\s*=\s*\S+\s+)?(?:TEMP(?:ORARY)?\s+)?'
+    r'(?:TRIGGER|PROCEDURE|FUNCTION)\b', re.IGNORECASE)
+# 'END IF', 'END LOOP' etc. fecham construções que não abriram bloco na contagem.
+_END_SUFFIXES = {'IF', 'LOOP', 'WHILE', 'REPEAT'}
+
+def _skip_spaces(script: str, index: int) -> int:
+    while index < len(script) and script[index].isspace():
+        index += 1
+    return index
+
+def split_statements(script: str, dialect: str) -> list:
+    """
+    Divide um script SQL em comandos executáveis um a um.
+
+    Ao contrário de script.split(';'), respeita literais ('...', "...", `...` no MySQL,
+    [...] no SQL Server e $tag$...$tag$ no PostgreSQL), comentários -- e /* */ e o corpo
+    BEGIN ... END de CREATE TRIGGER/PROCEDURE/FUNCTION. No SQL Server ('mssql') o separador
+    é a linha GO e cada lote é devolvido inteiro, como faz o sqlcmd. Trechos que só contêm
+    comentários são descartados.
+    """
+    is_mssql = dialect == 'mssql'
+    statements = []
+    length = len(script)
+    start = 0
+    i = 0
+    depth = 0
+    has_code = False
+    compound = None
+
+    def emit(end):
+        nonlocal start, depth, has_code, compound
+        statement = script[start:end].strip()
+        if has_code and statement:
+            statements.append(statement)
+        start, depth, has_code, compound = end + 1, 0, False, None
+
+    while i < length:
+        char = script[i]
+
+        if is_mssql and (i == 0 or script[i - 1] == '\n'):
+            go = _GO_LINE_REGEX.match(script, i)
+            if go:
+                emit(i - 1 if i else 0)
+                start = i = go.end()
+                continue
+
+        if char == '-' and script.startswith('--', i):
+            newline = script.find('\n', i)
+            i = length if newline == -1 else newline
+            continue
+        if char == '/' and script.startswith('/*', i):
+            close = script.find('*/', i + 2)
+            i = length if close == -1 else close + 2
+            continue
+
+        if char in ("'", '"') or (char == '`' and dialect in ('mysql', 'mariadb')) or (char == '[' and is_mssql):
+            closing = ']' if char == '[' else char
+            i += 1
+            while i < length:
+                if script[i] == closing:
+                    if script.startswith(closing * 2, i) and closing != ']':
+                        i += 2
+                        continue
+                    break
+                if script[i] == '\\' and closing != ']' and dialect in ('mysql', 'mariadb'):
+                    i += 1
+                i += 1
+            i += 1
+            has_code = True
+            continue
+
+        if char == '$' and dialect == 'postgresql':
+            tag = _DOLLAR_TAG_REGEX.match(script, i)
+            if tag and not (i and (script[i - 1].isalnum() or script[i - 1] == '_')):
+                close = script.find(tag.group(0), tag.end())
+                i = length if close == -1 else close + len(tag.group(0))
+                has_code = True
+                continue
+
+        if char.isascii() and (char.isalpha() or char == '_'):
+            word = _WORD_REGEX.match(script, i)
+            keyword = word.group(0).upper()
+            has_code = True
+            if compound is None:
+                compound = bool(_COMPOUND_REGEX.match(script, i))
+            if compound:
+                if keyword in ('BEGIN', 'CASE'):
+                    depth += 1
+                elif keyword == 'END':
+                    following = _WORD_REGEX.match(script, _skip_spaces(script, word.end()))
+                    if not (following and following.group(0).upper() in _END_SUFFIXES):
+                        depth = max(0, depth - 1)
+            i = word.end()
+            continue
+
+        if char == ';' and not is_mssql and depth == 0:
+            emit(i)
+        elif not char.isspace():
+            has_code = True
+        i += 1
+
+    emit(length)
+    return statements
@@ -13,6 +13,10 @@ setup_loggers()
 
 import config
 from persistencia.database import DatabaseManager
+from persistencia.db_executor import DatabaseExecutor
+from persistencia.audit_writer import AuditWriter
+from persistencia.index_manager import IndexManager
+from persistencia.migration_manager import MigrationManager
 from app import AplicacaoPrincipal
 
 def validar_configuracoes():
@@ -76,6 +80,21 @@ def main():
                                  f"Não foi possível inicializar ou conectar ao banco de dados.\n\nDetalhe: {e}")
             return
 
+    if config.DATABASE_ENABLED:
+        # As migrações independem de INITIALIZE_DATABASE_ON_STARTUP: bancos existentes também
+        # precisam receber as alterações de schema pendentes.
+        try:
+            MigrationManager.upgrade()
+        except Exception as e:
+            main_logger.critical(f"Falha ao aplicar as migrações do banco: {e}", exc_info=True)
+            messagebox.showerror("Erro de Banco de Dados",
+                                 f"Não foi possível atualizar o schema do banco de dados.\n\nDetalhe: {e}")
+            return
+        try:
+            IndexManager.ensure_indexes()
+        except Exception as e:
+            main_logger.error(f"Não foi possível verificar/criar os índices do banco: {e}", exc_info=True)
+
     main_logger.info("Iniciando a aplicação principal...")
     try:
         app = AplicacaoPrincipal(project_root=project_root)
@@ -84,6 +103,9 @@ def main():
     except Exception as e:
         main_logger.critical(f"Erro fatal na aplicação principal: {e}", exc_info=True)
         messagebox.showerror("Erro Crítico", f"A aplicação encontrou um erro fatal e precisa ser fechada: {e}")
+    finally:
+        AuditWriter.shutdown()
+        DatabaseExecutor.shutdown()
 
 if __name__ == "__main__":
     try: